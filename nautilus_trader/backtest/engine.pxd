@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.backtest.models cimport FillModel
@@ -44,6 +45,7 @@ cdef class BacktestEngine:
     cdef bint _log_to_file
     cdef bint _exec_db_flush
     cdef dict _exchanges
+    cdef int64_t _created_monotonic_ns
 
     cdef readonly Trader trader
     cdef readonly datetime created_time
@@ -13,9 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+
 import pytz
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
 
 from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.backtest.data_producer cimport BacktestDataProducer
@@ -142,6 +145,7 @@ cdef class BacktestEngine:
 
         self._clock = LiveClock()
         self.created_time = self._clock.utc_now_c()
+        self._created_monotonic_ns = self._clock.monotonic_ns()
 
         self._test_clock = TestClock()
         self._test_clock.set_time(self._clock.utc_now_c())
@@ -273,7 +277,10 @@ cdef class BacktestEngine:
 
         self.iteration = 0
 
-        self.time_to_initialize = self._clock.delta(self.created_time)
+        # Measured on the monotonic clock so unaffected by system clock adjustments
+        self.time_to_initialize = timedelta(
+            microseconds=(self._clock.monotonic_ns() - self._created_monotonic_ns) // 1000,
+        )
         self._log.info(f"Initialized in {self.time_to_initialize.total_seconds():.3f}s.")
         log_memory(self._log)
         self._log.info(f"Data size: {format_bytes(get_size_of(self._data_engine))}")
@@ -565,13 +572,21 @@ cdef class BacktestEngine:
     cdef void _advance_time(self, datetime timestamp) except *:
         cdef TradingStrategy strategy
         cdef TimeEventHandler event_handler
-        cdef list time_events = []  # type: list[TimeEventHandler]
+        cdef list time_events = []  # type: list[list[TimeEventHandler]]
         for strategy in self.trader.strategies_c():
             # noinspection PyUnresolvedReferences
-            time_events += strategy.clock.advance_time(timestamp)
-        for event_handler in sorted(time_events):
-            self._test_clock.set_time(event_handler.event.timestamp)
-            event_handler.handle()
+            time_events += strategy.clock.advance_time_runs(timestamp)
+
+        if len(time_events) == 1:
+            # Single run of events, already sorted
+            for event_handler in time_events[0]:
+                self._test_clock.set_time(event_handler.event.timestamp)
+                event_handler.handle()
+        elif time_events:
+            # Each run is sorted, so lazily merge all runs rather than re-sort
+            for event_handler in heapq.merge(*time_events):
+                self._test_clock.set_time(event_handler.event.timestamp)
+                event_handler.handle()
         self._test_clock.set_time(timestamp)
 
     cdef void _log_header(
@@ -16,9 +16,10 @@
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport LiveTimer
-from nautilus_trader.common.timer cimport TimeEvent
+from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.timer cimport Timer
 from nautilus_trader.common.uuid cimport UUIDFactory
 
@@ -27,7 +28,7 @@ cdef class Clock:
     cdef UUIDFactory _uuid_factory
     cdef dict _timers
     cdef dict _handlers
-    cdef Timer[:] _stack
+    cdef list _stack
     cdef object _default_handler
 
     cdef readonly bint is_test_clock
@@ -38,6 +39,8 @@ cdef class Clock:
     """The number of timers active in the clock.\n\n:returns: `int`"""
     cdef readonly datetime next_event_time
     """The timestamp of the next time event.\n\n:returns: `datetime`"""
+    cdef readonly int64_t next_event_time_ns
+    """The UNIX timestamp (nanoseconds) of the next time event.\n\n:returns: `int64`"""
     cdef readonly str next_event_name
     """The name of the next time event.\n\n:returns: `str`"""
 
@@ -46,6 +49,8 @@ cdef class Clock:
     cpdef datetime local_now(self, tzinfo tz)
     cpdef timedelta delta(self, datetime time)
     cpdef double unix_time(self)
+    cpdef int64_t timestamp_ns(self) except *
+    cpdef int64_t monotonic_ns(self) except *
     cpdef list timer_names(self)
     cpdef Timer timer(self, str name)
     cpdef void register_default_handler(self, handler: callable) except *
@@ -78,13 +83,26 @@ cdef class Clock:
 
 cdef class TestClock(Clock):
     cdef datetime _time
+    cdef int64_t _time_ns
     cdef dict _pending_events
 
     cpdef void set_time(self, datetime to_time) except *
     cpdef list advance_time(self, datetime to_time)
+    cpdef list advance_time_runs(self, datetime to_time)
 
 
 cdef class LiveClock(Clock):
-    cpdef void _raise_time_event(self, LiveTimer timer) except *
+    cdef object _loop
+    cdef object _loop_handle
+    cdef object _lock
+    cdef object _thread
 
-    cdef inline void _handle_time_event(self, TimeEvent event) except *
+    cpdef object get_event_loop(self)
+    cdef inline void _notify_dispatcher(self) except *
+    cpdef void _run_timers(self) except *
+    cdef inline void _handle_event(self, TimeEventHandler event_handler) except *
+    cdef inline bint _on_loop_thread(self) except *
+    cpdef void _reschedule(self) except *
+    cdef inline void _schedule_on_loop(self) except *
+    cpdef void _run_loop_timers(self) except *
+    cdef inline list _pop_due_events(self)
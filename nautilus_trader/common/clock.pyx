@@ -13,20 +13,28 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import cython
-import numpy as np
-import pytz
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
+import heapq
+import sys
+import threading
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
+from libc.stdint cimport int64_t
 
+from nautilus_trader.common.timer cimport LiveTimer
 from nautilus_trader.common.timer cimport TestTimer
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport UNIX_EPOCH
+from nautilus_trader.core.datetime cimport dt_to_unix_nanos
+from nautilus_trader.core.datetime cimport nanos_to_unix_dt
+from nautilus_trader.core.time cimport monotonic_ns
 from nautilus_trader.core.time cimport unix_time
+from nautilus_trader.core.time cimport unix_time_ns
 
 
 cdef class Clock:
@@ -43,13 +51,14 @@ cdef class Clock:
         self._uuid_factory = UUIDFactory()
         self._timers = {}    # type: dict[str, Timer]
         self._handlers = {}  # type: dict[str, callable]
-        self._stack = None
+        self._stack = []     # type: list[Timer]
         self._default_handler = None
         self.is_test_clock = False
         self.is_default_handler_registered = False
 
         self.timer_count = 0
         self.next_event_time = None
+        self.next_event_time_ns = 0
         self.next_event_name = None
 
     cpdef datetime utc_now(self):
@@ -109,6 +118,14 @@ cdef class Clock:
         """
         return unix_time()
 
+    cpdef int64_t timestamp_ns(self) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
+    cpdef int64_t monotonic_ns(self) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")
+
     cpdef list timer_names(self):
         """
         The timer names held by the clock.
@@ -268,15 +285,14 @@ cdef class Clock:
             handler = self._default_handler
         Condition.not_in(name, self._timers, "name", "timers")
         Condition.not_in(name, self._handlers, "name", "timers")
-        Condition.true(interval.total_seconds() > 0, "interval positive")
         Condition.callable(handler, "handler")
 
+        # The interval and start/stop time checks are made by the timer
         cdef datetime now = self.utc_now_c()
         if start_time is None:
             start_time = now
         if stop_time is not None:
             Condition.true(stop_time > now, "stop_time > now")
-            Condition.true(start_time + interval <= stop_time, "start_time + interval <= stop_time")
 
         cdef Timer timer = self._create_timer(
             name=name,
@@ -341,44 +357,42 @@ cdef class Clock:
         self._timers[timer.name] = timer
         self._handlers[timer.name] = handler
         self._update_stack()
-        self._update_timing()
+
+        # Only the new timer can become the next event, no need to scan
+        if self.timer_count == 1 or timer.next_time_ns < self.next_event_time_ns:
+            self.next_event_time = timer.next_time
+            self.next_event_time_ns = timer.next_time_ns
 
     cdef inline void _remove_timer(self, Timer timer) except *:
         self._timers.pop(timer.name, None)
         self._handlers.pop(timer.name, None)
         self._update_stack()
-        self._update_timing()
+
+        # Only scan for the next event if the removed timer may have been it
+        if timer.next_time_ns <= self.next_event_time_ns:
+            self._update_timing()
 
     cdef void _update_stack(self) except *:
         self.timer_count = len(self._timers)
 
-        if self.timer_count > 0:
-            # The call to np.asarray here looks inefficient, however the intention
-            # is that its only called when a timer is added or removed only.
-            # This then allows the construction of an efficient Timer[:] memory view.
-            self._stack = np.asarray(list(self._timers.values()))
-        else:
-            self._stack = None
+        # A fresh list is built (rather than mutating in place) so that callers
+        # iterating the previous stack may safely add or remove timers.
+        self._stack = list(self._timers.values())
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef inline void _update_timing(self) except *:
         if self.timer_count == 0:
             self.next_event_time = None
-            return
-        elif self.timer_count == 1:
-            self.next_event_time = self._stack[0].next_time
+            self.next_event_time_ns = 0
             return
 
-        cdef datetime next_time = self._stack[0].next_time
-        cdef datetime observed
-        cdef int i
-        for i in range(self.timer_count - 1):
-            observed = self._stack[i + 1].next_time
-            if observed < next_time:
-                next_time = observed
+        cdef Timer next_timer = self._stack[0]
+        cdef Timer timer
+        for timer in self._stack:
+            if timer.next_time_ns < next_timer.next_time_ns:
+                next_timer = timer
 
-        self.next_event_time = next_time
+        self.next_event_time = next_timer.next_time
+        self.next_event_time_ns = next_timer.next_time_ns
 
 
 cdef class TestClock(Clock):
@@ -400,6 +414,7 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._time = initial_time
+        self._time_ns = dt_to_unix_nanos(initial_time)
         self.is_test_clock = True
 
     cpdef datetime utc_now(self):
@@ -415,6 +430,31 @@ cdef class TestClock(Clock):
     cdef datetime utc_now_c(self):
         return self._time
 
+    cpdef int64_t timestamp_ns(self) except *:
+        """
+        Return the current UNIX time of the clock in nanoseconds.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self._time_ns
+
+    cpdef int64_t monotonic_ns(self) except *:
+        """
+        Return the current monotonic time of the clock in nanoseconds.
+
+        For the test clock this is the same as the UNIX time, which only ever
+        moves forwards.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self._time_ns
+
     cpdef void set_time(self, datetime to_time) except *:
         """
         Set the clocks datetime to the given time (UTC).
@@ -428,6 +468,7 @@ cdef class TestClock(Clock):
         Condition.not_none(to_time, "to_time")
 
         self._time = to_time
+        self._time_ns = dt_to_unix_nanos(to_time)
 
     cpdef list advance_time(self, datetime to_time):
         """
@@ -443,6 +484,36 @@ cdef class TestClock(Clock):
         list[TimeEvent]
             Sorted chronologically.
 
+        Raises
+        ------
+        ValueError
+            If to_time is < the clocks current time.
+
+        """
+        cdef list runs = self.advance_time_runs(to_time)
+        if not runs:
+            return []  # No timer events
+        if len(runs) == 1:
+            return runs[0]  # Already sorted, nothing to merge
+        return list(heapq.merge(*runs))
+
+    cpdef list advance_time_runs(self, datetime to_time):
+        """
+        Advance the clocks time to the given `datetime`, returning the time
+        events as one chronologically sorted run per timer.
+
+        This allows callers handling events from several clocks to lazily merge
+        all runs together, rather than materializing a sorted list per clock.
+
+        Parameters
+        ----------
+        to_time : datetime
+            The datetime to advance the clock to.
+
+        Returns
+        -------
+        list[list[TimeEventHandler]]
+
         Raises
         ------
         ValueError
@@ -450,29 +521,29 @@ cdef class TestClock(Clock):
 
         """
         Condition.not_none(to_time, "to_time")
-        Condition.true(to_time >= self._time, "to_time >= self._time")  # Ensure monotonic
 
-        cdef list event_handlers = []
+        # Converted once so all further comparisons are on integers
+        cdef int64_t to_time_ns = dt_to_unix_nanos(to_time)
+        Condition.true(to_time_ns >= self._time_ns, "to_time >= self._time")  # Ensure monotonic
 
-        if self.timer_count == 0 or to_time < self.next_event_time:
+        if self.timer_count == 0 or to_time_ns < self.next_event_time_ns:
             self._time = to_time
-            return event_handlers  # No timer events to iterate
+            self._time_ns = to_time_ns
+            return []  # No timer events to iterate
 
-        # Iterate timer events
+        cdef list runs = []  # type: list[list[TimeEventHandler]]
         cdef TestTimer timer
-        cdef TimeEvent event
-        for timer in self._stack:
-            for event in timer.advance(to_time):
-                event_handlers.append(TimeEventHandler(event, timer.callback))
-
-        # Remove expired timers
         for timer in self._stack:
+            if timer.next_time_ns > to_time_ns:
+                continue  # No events due for this timer
+            runs.append([TimeEventHandler(event, timer.callback) for event in timer.advance(to_time_ns)])
             if timer.expired:
                 self._remove_timer(timer)
 
         self._update_timing()
         self._time = to_time
-        return sorted(event_handlers)
+        self._time_ns = to_time_ns
+        return runs
 
     cdef Timer _create_timer(
         self,
@@ -489,20 +560,45 @@ cdef class TestClock(Clock):
             interval=interval,
             start_time=start_time,
             stop_time=stop_time,
+            uuid_factory=self._uuid_factory,
         )
 
 
 cdef class LiveClock(Clock):
     """
     Provides a clock for live trading. All times are timezone aware UTC.
+
+    If an event loop is given then time events are scheduled on the loop, with
+    a single loop callback for the next time event across all timers.
+
+    Otherwise all timers are driven from a single internal dispatcher thread
+    which sleeps until the next time event is due. The thread is started when
+    the first timer is set, and exits once no timers remain.
     """
 
-    def __init__(self):
+    def __init__(self, loop: AbstractEventLoop=None):
         """
         Initialize a new instance of the `LiveClock` class.
+
+        Parameters
+        ----------
+        loop : AbstractEventLoop, optional
+            The event loop to schedule time events on. If None then time events
+            are dispatched from an internal thread.
+
+        Notes
+        -----
+        When running on an event loop, timers set or cancelled from any other
+        thread are rescheduled on the loop thread.
+
         """
         super().__init__()
 
+        self._loop = loop
+        self._loop_handle = None  # The loop callback for the next time event
+        self._lock = threading.Condition()
+        self._thread = None
+
     cpdef datetime utc_now(self):
         """
         Returns
@@ -514,16 +610,77 @@ cdef class LiveClock(Clock):
         return self.utc_now_c()
 
     cdef datetime utc_now_c(self):
-        # Regarding the below call to pytz.utc
-        # From the pytz docs https://pythonhosted.org/pytz/
-        # -------------------------------------------------
-        # Unfortunately using the tzinfo argument of the standard datetime
-        # constructors ‘’does not work’’ with pytz for many timezones.
-        # It is safe for timezones without daylight saving transitions though,
-        # such as UTC. The preferred way of dealing with times is to always work
-        # in UTC, converting to localtime only when generating output to be read
-        # by humans.
-        return datetime.now(tz=pytz.utc)
+        # Built from the system clock nanoseconds as an offset from the pytz
+        # UTC epoch. This avoids datetime.now(tz=pytz.utc), which dispatches
+        # through the pure Python pytz.utc.fromutc() on every call.
+        return nanos_to_unix_dt(unix_time_ns())
+
+    cpdef int64_t timestamp_ns(self) except *:
+        """
+        Return the current UNIX time of the clock in nanoseconds.
+
+        Returns
+        -------
+        int64
+
+        """
+        return unix_time_ns()
+
+    cpdef int64_t monotonic_ns(self) except *:
+        """
+        Return the current monotonic time of the clock in nanoseconds.
+
+        The value is only meaningful relative to other monotonic times, and
+        should be used for measuring durations (unaffected by system clock
+        adjustments).
+
+        Returns
+        -------
+        int64
+
+        """
+        return monotonic_ns()
+
+    cpdef object get_event_loop(self):
+        """
+        Return the event loop time events are scheduled on (if set).
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop or None
+
+        """
+        return self._loop
+
+    cpdef void set_time_alert(
+        self,
+        str name,
+        datetime alert_time,
+        handler: callable=None,
+    ) except *:
+        # Docstring inherited
+        with self._lock:
+            Clock.set_time_alert(self, name, alert_time, handler)
+            self._notify_dispatcher()
+
+    cpdef void set_timer(
+        self,
+        str name,
+        timedelta interval,
+        datetime start_time=None,
+        datetime stop_time=None,
+        handler: callable=None,
+    ) except *:
+        # Docstring inherited
+        with self._lock:
+            Clock.set_timer(self, name, interval, start_time, stop_time, handler)
+            self._notify_dispatcher()
+
+    cpdef void cancel_timer(self, str name) except *:
+        # Docstring inherited
+        with self._lock:
+            Clock.cancel_timer(self, name)
+            self._notify_dispatcher()
 
     cdef Timer _create_timer(
         self,
@@ -536,26 +693,120 @@ cdef class LiveClock(Clock):
     ):
         return LiveTimer(
             name=name,
-            callback=self._raise_time_event,
+            callback=callback,
             interval=interval,
-            now=now,
             start_time=start_time,
             stop_time=stop_time,
         )
 
-    cpdef void _raise_time_event(self, LiveTimer timer) except *:
-        cdef datetime now = self.utc_now_c()
-        cdef TimeEvent event = timer.pop_event(self._uuid_factory.generate())
-        timer.iterate_next_time(now)
-        self._handle_time_event(event)
-
-        if timer.expired:
-            self._remove_timer(timer)
-        else:  # Continue timing
-            timer.repeat(now)
-            self._update_timing()
+    cdef inline void _notify_dispatcher(self) except *:
+        # Must be called while holding the lock
+        if self._loop is not None:
+            if self._on_loop_thread():
+                self._schedule_on_loop()
+            elif not self._loop.is_closed():  # Nothing to schedule once the loop is disposed
+                # The loop is not thread-safe, so hand over to the loop thread
+                self._loop.call_soon_threadsafe(self._reschedule)
+            return
+
+        if self._thread is None:
+            if self.timer_count == 0:
+                return  # Nothing to dispatch
+            self._thread = threading.Thread(target=self._run_timers, daemon=True)
+            self._thread.start()
+        else:
+            self._lock.notify()
+
+    cpdef void _run_timers(self) except *:
+        cdef double timeout
+        cdef list event_handlers
+        cdef TimeEventHandler event_handler
+        try:
+            while True:
+                with self._lock:
+                    if self.timer_count == 0:
+                        # Allows a new dispatcher to be started by the next timer set
+                        self._thread = None
+                        return
+                    timeout = (self.next_event_time_ns - unix_time_ns()) / 1e9
+                    if timeout > 0:
+                        # Woken early if timers are set or cancelled in the meantime
+                        self._lock.wait(timeout)
+                        continue
+                    event_handlers = self._pop_due_events()
+
+                # Handlers are invoked as a batch outside the lock so that
+                # setting or cancelling timers is never blocked by a handler.
+                for event_handler in event_handlers:
+                    self._handle_event(event_handler)
+        except Exception:
+            with self._lock:
+                self._thread = None
+            raise
+
+    cdef inline void _handle_event(self, TimeEventHandler event_handler) except *:
+        # The dispatcher is shared by every timer on the clock, so an exception
+        # from one handler is reported rather than stopping all other timers
+        # or dropping the remaining events of the batch.
+        try:
+            event_handler.handle()
+        except Exception as ex:
+            if self._loop is not None:
+                self._loop.call_exception_handler({
+                    "message": f"Exception in handler for {event_handler.event}",
+                    "exception": ex,
+                })
+            else:
+                sys.excepthook(type(ex), ex, ex.__traceback__)
+
+    cdef inline bint _on_loop_thread(self) except *:
+        try:
+            return get_running_loop() is self._loop
+        except RuntimeError:
+            return False  # No loop running on this thread
+
+    cpdef void _reschedule(self) except *:
+        with self._lock:
+            self._schedule_on_loop()
+
+    cdef inline void _schedule_on_loop(self) except *:
+        # Must be called while holding the lock, from the loop thread
+        if self._loop_handle is not None:
+            self._loop_handle.cancel()
+            self._loop_handle = None
 
-    cdef inline void _handle_time_event(self, TimeEvent event) except *:
-        handler = self._handlers.get(event.name)
-        if handler is not None:
-            handler(event)
+        if self.timer_count == 0:
+            return  # Nothing to schedule
+
+        cdef double delay = (self.next_event_time_ns - unix_time_ns()) / 1e9
+        self._loop_handle = self._loop.call_later(max(delay, 0.), self._run_loop_timers)
+
+    cpdef void _run_loop_timers(self) except *:
+        cdef list event_handlers
+        with self._lock:
+            self._loop_handle = None
+            event_handlers = self._pop_due_events()
+            self._schedule_on_loop()
+
+        cdef TimeEventHandler event_handler
+        for event_handler in event_handlers:
+            self._handle_event(event_handler)
+
+    cdef inline list _pop_due_events(self):
+        cdef int64_t now_ns = unix_time_ns()
+        cdef datetime now = nanos_to_unix_dt(now_ns)
+        cdef list event_handlers = []  # type: list[TimeEventHandler]
+        cdef LiveTimer timer
+        for timer in self._stack:
+            if timer.next_time_ns > now_ns:
+                continue
+            event_handlers.append(TimeEventHandler(
+                timer.pop_event(self._uuid_factory.generate()),
+                timer.callback,
+            ))
+            timer.iterate_next_time(now)
+            if timer.expired:
+                self._remove_timer(timer)
+
+        self._update_timing()
+        return sorted(event_handlers)
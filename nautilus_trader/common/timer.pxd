@@ -15,6 +15,7 @@
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.message cimport Event
@@ -43,10 +44,16 @@ cdef class Timer:
     """The timers set interval.\n\n:returns: `timedelta`"""
     cdef readonly datetime start_time
     """The timers set start time.\n\n:returns: `datetime`"""
+    cdef readonly int64_t interval_ns
+    """The timers set interval in nanoseconds.\n\n:returns: `int64`"""
     cdef readonly datetime next_time
     """The timers next alert timestamp.\n\n:returns: `datetime`"""
+    cdef readonly int64_t next_time_ns
+    """The timers next alert UNIX timestamp in nanoseconds.\n\n:returns: `int64`"""
     cdef readonly datetime stop_time
     """The timers set stop time (if set).\n\n:returns: `datetime`"""
+    cdef readonly int64_t stop_time_ns
+    """The timers set stop UNIX timestamp in nanoseconds (zero if not set).\n\n:returns: `int64`"""
     cdef readonly bint expired
     """If the timer is expired.\n\n:returns: `bool`"""
 
@@ -59,11 +66,8 @@ cdef class TestTimer(Timer):
     cdef UUIDFactory _uuid_factory
 
     cpdef Event pop_next_event(self)
-    cpdef list advance(self, datetime to_time)
+    cpdef list advance(self, int64_t to_time_ns)
 
 
 cdef class LiveTimer(Timer):
-    cdef object _internal
-
-    cpdef void repeat(self, datetime now) except *
-    cdef object _start_timer(self, datetime now)
+    pass
@@ -13,14 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from threading import Timer as TimerThread
-
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport format_iso8601
+from nautilus_trader.core.datetime cimport timedelta_to_nanos
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.core.uuid cimport UUID
 
@@ -60,6 +61,9 @@ cdef class TimeEvent(Event):
     def __ne__(self, TimeEvent other) -> bool:
         return self.name != other.name
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     def __repr__(self) -> str:
         return (f"{type(self).__name__}("
                 f"name={self.name}, "
@@ -136,16 +140,24 @@ cdef class Timer:
         """
         Condition.valid_string(name, "name")
         Condition.callable(callback, "function")
-        Condition.positive(interval.total_seconds(), "interval")
+
+        # Checks are made on integer nanoseconds, converted once here
+        cdef int64_t interval_ns = timedelta_to_nanos(interval)
+        cdef int64_t start_time_ns = dt_to_unix_nanos(start_time)
+        cdef int64_t stop_time_ns = dt_to_unix_nanos(stop_time) if stop_time else 0
+        Condition.true(interval_ns > 0, "interval positive")
         if stop_time:
-            Condition.true(start_time + interval <= stop_time, "start_time + interval <= stop_time")
+            Condition.true(start_time_ns + interval_ns <= stop_time_ns, "start_time + interval <= stop_time")
 
         self.name = name
         self.callback = callback
         self.interval = interval
+        self.interval_ns = interval_ns
         self.start_time = start_time
         self.next_time = start_time + interval
+        self.next_time_ns = start_time_ns + interval_ns
         self.stop_time = stop_time
+        self.stop_time_ns = stop_time_ns
         self.expired = False
 
     def __eq__(self, Timer other) -> bool:
@@ -192,6 +204,7 @@ cdef class Timer:
         Condition.not_none(now, "now")
 
         self.next_time += self.interval
+        self.next_time_ns += self.interval_ns
         if self.stop_time and now >= self.stop_time:
             self.expired = True
 
@@ -212,7 +225,8 @@ cdef class TestTimer(Timer):
         callback not None: callable,
         timedelta interval not None,
         datetime start_time not None,
-        datetime stop_time=None
+        datetime stop_time=None,
+        UUIDFactory uuid_factory=None,
     ):
         """
         Initialize a new instance of the `TestTimer` class.
@@ -229,35 +243,59 @@ cdef class TestTimer(Timer):
             The stop datetime for the timer (UTC).
         stop_time : datetime, optional
             The stop datetime for the timer (UTC) (if None then timer repeats).
+        uuid_factory : UUIDFactory, optional
+            The factory for time event identifiers (if None then a new factory).
 
         """
         Condition.valid_string(name, "name")
         super().__init__(name, callback, interval, start_time, stop_time)
 
-        self._uuid_factory = UUIDFactory()
+        if uuid_factory is None:
+            uuid_factory = UUIDFactory()
 
-    cpdef list advance(self, datetime to_time):
+        self._uuid_factory = uuid_factory
+
+    cpdef list advance(self, int64_t to_time_ns):
         """
         Advance the test timer forward to the given time, generating a sequence
         of events. A time event is appended for each time a next event is
-        <= the given to_time.
+        <= the given to_time_ns.
 
         Parameters
         ----------
-        to_time : datetime
-            The time to advance the test timer to.
+        to_time_ns : int64
+            The UNIX time (nanoseconds) to advance the test timer to.
 
         Returns
         -------
         list[TimeEvent]
 
         """
-        Condition.not_none(to_time, "to_time")
+        if self.expired or to_time_ns < self.next_time_ns:
+            return []
+
+        # Count the events up to the given time in one step, rather than
+        # iterating (and checking for expiry) one event at a time.
+        cdef int64_t count = (to_time_ns - self.next_time_ns) // self.interval_ns + 1
+        cdef int64_t count_to_stop
+        if self.stop_time is not None:
+            # The timer expires on the first event at or beyond the stop time
+            count_to_stop = 1
+            if self.stop_time_ns > self.next_time_ns:
+                count_to_stop += (self.stop_time_ns - self.next_time_ns + self.interval_ns - 1) // self.interval_ns
+            if count_to_stop <= count:
+                count = count_to_stop
+                self.expired = True
 
         cdef list events = []  # type: list[TimeEvent]
-        while not self.expired and to_time >= self.next_time:
-            events.append(self.pop_event(self._uuid_factory.generate()))
-            self.iterate_next_time(self.next_time)
+        cdef datetime timestamp = self.next_time
+        cdef int64_t i
+        for i in range(count):
+            events.append(TimeEvent(self.name, self._uuid_factory.generate(), timestamp))
+            timestamp += self.interval
+
+        self.next_time = timestamp
+        self.next_time_ns += count * self.interval_ns
 
         return events
 
@@ -290,6 +328,9 @@ cdef class TestTimer(Timer):
 cdef class LiveTimer(Timer):
     """
     Provides a timer for live trading.
+
+    The timer does not run a thread of its own, it is driven by the
+    `LiveClock` which owns it.
     """
 
     def __init__(
@@ -297,7 +338,6 @@ cdef class LiveTimer(Timer):
         str name not None,
         callback not None: callable,
         timedelta interval not None,
-        datetime now not None,
         datetime start_time not None,
         datetime stop_time=None,
     ):
@@ -312,8 +352,6 @@ cdef class LiveTimer(Timer):
             The function to call at the next time.
         interval : timedelta
             The time interval for the timer.
-        now : datetime
-            The datetime now (UTC).
         start_time : datetime
             The start datetime for the timer (UTC).
         stop_time : datetime, optional
@@ -328,35 +366,8 @@ cdef class LiveTimer(Timer):
         Condition.valid_string(name, "name")
         super().__init__(name, callback, interval, start_time, stop_time)
 
-        self._internal = self._start_timer(now)
-
-    cpdef void repeat(self, datetime now) except *:
-        """
-        Continue the timer.
-
-        Parameters
-        ----------
-        now : datetime
-            The current time to base the repeat from.
-
-        """
-        Condition.not_none(now, "now")
-
-        self._internal = self._start_timer(now)
-
     cpdef void cancel(self) except *:
         """
         Cancels the timer (the timer will not generate an event).
         """
-        self._internal.cancel()
-
-    cdef object _start_timer(self, datetime now):
-        timer = TimerThread(
-            interval=(self.next_time - now).total_seconds(),
-            function=self.callback,
-            args=[self],
-        )
-        timer.daemon = True
-        timer.start()
-
-        return timer
+        self.expired = True
@@ -18,11 +18,39 @@ import os
 from nautilus_trader.core.uuid cimport UUID
 
 
+cdef int _UUID_BATCH_SIZE = 256
+
+# Random bytes are buffered once per process and shared by all factories, so
+# creating a factory (e.g. per timer) does not pay for a fresh batch.
+cdef bytes _buffer = b""  # Filled lazily on first generate
+cdef int _offset = 0
+
+
+def _after_fork_in_child():
+    # Discard bytes buffered before the fork, which the parent would
+    # otherwise also hand out.
+    global _buffer, _offset
+    _buffer = b""
+    _offset = 0
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 cdef class UUIDFactory:
     """
     Provides a factory which generates version 4 UUID's.
+
+    Random bytes are read from the OS in batches shared by all factories in
+    the process, rather than making a system call for every UUID generated.
     """
 
+    def __init__(self):
+        """
+        Initialize a new instance of the `UUIDFactory` class.
+        """
+
     cpdef UUID generate(self):
         """
         Return a generated UUID version 4.
@@ -35,4 +63,11 @@ cdef class UUIDFactory:
         return self.generate_c()
 
     cdef UUID generate_c(self):
-        return UUID(value=os.urandom(16))
+        global _buffer, _offset
+        if _offset >= len(_buffer):
+            _buffer = os.urandom(16 * _UUID_BATCH_SIZE)
+            _offset = 0
+
+        cdef bytes value = _buffer[_offset:_offset + 16]
+        _offset += 16
+        return UUID(value=value)
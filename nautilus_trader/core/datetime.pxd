@@ -14,12 +14,17 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 cdef datetime UNIX_EPOCH
 
 
 cpdef long to_posix_ms(datetime timestamp) except *
 cpdef datetime from_posix_ms(long posix)
+cpdef int64_t timedelta_to_nanos(timedelta delta) except *
+cpdef int64_t dt_to_unix_nanos(datetime timestamp) except *
+cpdef datetime nanos_to_unix_dt(int64_t nanos)
 cpdef bint is_datetime_utc(datetime timestamp) except *
 cpdef bint is_tz_aware(time_object) except *
 cpdef bint is_tz_naive(time_object) except *
@@ -19,16 +19,25 @@ related operations. Functions include awareness/tz checks and conversions, as
 well as ISO 8601 conversion.
 """
 
+import cython
 import pandas as pd
 import pytz
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport datetime_tzinfo
+from cpython.datetime cimport import_datetime
 from cpython.datetime cimport timedelta
+from cpython.datetime cimport timedelta_days
+from cpython.datetime cimport timedelta_microseconds
+from cpython.datetime cimport timedelta_new
+from cpython.datetime cimport timedelta_seconds
 from cpython.unicode cimport PyUnicode_Contains
 
 from nautilus_trader.core.correctness cimport Condition
 
+# Initialize the datetime C API (required for timedelta_new)
+import_datetime()
+
 # Unix epoch is the UTC time at 00:00:00 on 1/1/1970
 UNIX_EPOCH = datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
@@ -67,6 +76,69 @@ cpdef datetime from_posix_ms(long posix):
     return UNIX_EPOCH + timedelta(milliseconds=posix)  # Round off thousands
 
 
+cpdef int64_t timedelta_to_nanos(timedelta delta) except *:
+    """
+    Returns the total number of nanoseconds in the given timedelta.
+
+    Parameters
+    ----------
+    delta : timedelta
+        The timedelta to convert.
+
+    Returns
+    -------
+    int64
+
+    """
+    return ((<int64_t>timedelta_days(delta) * 86400 + timedelta_seconds(delta)) * 1_000_000_000
+            + <int64_t>timedelta_microseconds(delta) * 1000)
+
+
+cpdef int64_t dt_to_unix_nanos(datetime timestamp) except *:
+    """
+    Returns the UNIX nanosecond timestamp from the given datetime.
+
+    Parameters
+    ----------
+    timestamp : datetime
+        The tz-aware datetime for the timestamp.
+
+    Returns
+    -------
+    int64
+
+    """
+    if type(timestamp) is not datetime and isinstance(timestamp, pd.Timestamp):
+        # Already held as UNIX nanoseconds, avoiding a slow pd.Timedelta
+        # subtraction which would also truncate the nanosecond component.
+        return timestamp.value
+    return timedelta_to_nanos(timestamp - UNIX_EPOCH)
+
+
+@cython.cdivision(False)  # Floor division for timestamps prior to the epoch
+cpdef datetime nanos_to_unix_dt(int64_t nanos):
+    """
+    Returns the datetime in UTC from the given UNIX nanosecond timestamp.
+
+    Parameters
+    ----------
+    nanos : int64
+        The nanosecond timestamp to convert (sub-microsecond precision is
+        truncated as datetime resolution is microseconds).
+
+    Returns
+    -------
+    datetime
+
+    """
+    # Split into normalized components for the C API timedelta constructor,
+    # avoiding a keyword argument call to the timedelta type.
+    cdef int64_t micros = nanos // 1000
+    cdef int64_t seconds = micros // 1_000_000
+    cdef int64_t days = seconds // 86400
+    return UNIX_EPOCH + timedelta_new(days, seconds - days * 86400, micros - seconds * 1_000_000)
+
+
 cpdef bint is_datetime_utc(datetime timestamp) except *:
     """
     Return a value indicating whether the given timestamp is timezone aware UTC.
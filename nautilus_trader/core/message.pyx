@@ -124,7 +124,9 @@ cdef class Message:
         return self.type != other.type or self.id != other.id
 
     def __hash__(self) -> int:
-        return hash((self.type, self.id))
+        # The identifier alone is sufficient (and consistent with equality),
+        # this avoids allocating and hashing a tuple on every call.
+        return hash(self.id)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(id={self.id}, timestamp={self.timestamp})"
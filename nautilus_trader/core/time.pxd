@@ -7,9 +7,18 @@ from libc.stdint cimport int64_t
 cdef extern from "pytime.h":
     ctypedef int64_t _PyTime_t
     _PyTime_t _PyTime_GetSystemClock() nogil
+    _PyTime_t _PyTime_GetMonotonicClock() nogil
     double _PyTime_AsSecondsDouble(_PyTime_t t) nogil
 
 
+cdef inline int64_t unix_time_ns() nogil:
+    return _PyTime_GetSystemClock()
+
+
+cdef inline int64_t monotonic_ns() nogil:
+    return _PyTime_GetMonotonicClock()
+
+
 cdef inline double unix_time() nogil:
     cdef:
         _PyTime_t tic
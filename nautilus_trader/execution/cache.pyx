@@ -36,6 +36,19 @@ from nautilus_trader.trading.account cimport Account
 from nautilus_trader.trading.strategy cimport TradingStrategy
 
 
+cdef inline set _intersection(list sets):
+    # Intersect from the smallest set up so each pass only iterates over the
+    # (already reduced) result rather than the larger index sets.
+    sets.sort(key=len)
+    cdef set result = sets[0].intersection(sets[1])
+    cdef set other
+    for other in sets[2:]:
+        if not result:
+            break
+        result.intersection_update(other)
+    return result
+
+
 cdef class ExecutionCache(ExecutionCacheFacade):
     """
     Provides a cache for the `ExecutionEngine`.
@@ -828,16 +841,19 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             # Assumes order_id does not change
             self._index_order_ids[order.id] = order.cl_ord_id
 
-        if order.is_active_c():
+        # Move the order between the state indexes (an order is always
+        # exactly one of active or completed, working orders are also active)
+        if order.is_completed_c():
+            self._index_orders_completed.add(order.cl_ord_id)
+            self._index_orders_active.discard(order.cl_ord_id)
+            self._index_orders_working.discard(order.cl_ord_id)
+        else:
             self._index_orders_active.add(order.cl_ord_id)
             self._index_orders_completed.discard(order.cl_ord_id)
             if order.is_working_c():
-                # Working order is also active
                 self._index_orders_working.add(order.cl_ord_id)
-        elif order.is_completed_c():
-            self._index_orders_completed.add(order.cl_ord_id)
-            self._index_orders_active.discard(order.cl_ord_id)
-            self._index_orders_working.discard(order.cl_ord_id)
+            else:
+                self._index_orders_working.discard(order.cl_ord_id)
 
         # Update database
         self._database.update_order(order)
@@ -857,6 +873,9 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         if position.is_closed_c():
             self._index_positions_closed.add(position.id)
             self._index_positions_open.discard(position.id)
+        else:
+            self._index_positions_open.add(position.id)
+            self._index_positions_closed.discard(position.id)
 
         # Update database
         self._database.update_position(position)
@@ -981,33 +1000,43 @@ cdef class ExecutionCache(ExecutionCacheFacade):
 
 # -- IDENTIFIER QUERIES ----------------------------------------------------------------------------
 
-    cdef inline set _build_ord_query_filter_set(self, Symbol symbol, StrategyId strategy_id):
-        cdef set query = None
+    cdef inline set _filter_ord_ids(self, set index, Symbol symbol, StrategyId strategy_id):
+        if symbol is None and strategy_id is None:
+            return index
 
-        # Build potential query set
+        cdef list query = [index]
+        cdef set filter_set
         if symbol is not None:
-            query = self._index_symbol_orders.get(symbol, set())
+            filter_set = self._index_symbol_orders.get(symbol)
+            if not filter_set:
+                return set()
+            query.append(filter_set)
         if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_orders.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_orders.get(strategy_id, set()))
+            filter_set = self._index_strategy_orders.get(strategy_id)
+            if not filter_set:
+                return set()
+            query.append(filter_set)
 
-        return query
+        return _intersection(query)
 
-    cdef inline set _build_pos_query_filter_set(self, Symbol symbol, StrategyId strategy_id):
-        cdef set query = None
+    cdef inline set _filter_pos_ids(self, set index, Symbol symbol, StrategyId strategy_id):
+        if symbol is None and strategy_id is None:
+            return index
 
-        # Build potential query set
+        cdef list query = [index]
+        cdef set filter_set
         if symbol is not None:
-            query = self._index_symbol_positions.get(symbol, set())
+            filter_set = self._index_symbol_positions.get(symbol)
+            if not filter_set:
+                return set()
+            query.append(filter_set)
         if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
+            filter_set = self._index_strategy_positions.get(strategy_id)
+            if not filter_set:
+                return set()
+            query.append(filter_set)
 
-        return query
+        return _intersection(query)
 
     cpdef set order_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1025,12 +1054,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_orders
-        else:
-            return self._index_orders.intersection(query)
+        return self._filter_ord_ids(self._index_orders, symbol, strategy_id)
 
     cpdef set order_active_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1049,12 +1073,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_orders_active
-        else:
-            return self._index_orders_active.intersection(query)
+        return self._filter_ord_ids(self._index_orders_active, symbol, strategy_id)
 
     cpdef set order_working_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1073,12 +1092,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_orders_working
-        else:
-            return self._index_orders_working.intersection(query)
+        return self._filter_ord_ids(self._index_orders_working, symbol, strategy_id)
 
     cpdef set order_completed_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1097,12 +1111,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_orders_completed
-        else:
-            return self._index_orders_completed.intersection(query)
+        return self._filter_ord_ids(self._index_orders_completed, symbol, strategy_id)
 
     cpdef set position_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1120,12 +1129,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_positions
-        else:
-            return self._index_positions.intersection(query)
+        return self._filter_pos_ids(self._index_positions, symbol, strategy_id)
 
     cpdef set position_open_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1143,12 +1147,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if not query:
-            return self._index_positions_open
-        else:
-            return self._index_positions_open.intersection(query)
+        return self._filter_pos_ids(self._index_positions_open, symbol, strategy_id)
 
     cpdef set position_closed_ids(self, Symbol symbol=None, StrategyId strategy_id=None):
         """
@@ -1166,12 +1165,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(symbol, strategy_id)
-
-        if query is None:
-            return self._index_positions_closed
-        else:
-            return self._index_positions_closed.intersection(query)
+        return self._filter_pos_ids(self._index_positions_closed, symbol, strategy_id)
 
     cpdef set strategy_ids(self):
         """
@@ -97,10 +97,11 @@ class TradingNode:
         config_strategy = config.get("strategy", {})
         config_adapters = config.get("adapters", {})
 
-        self._clock = LiveClock()
+        self._loop = asyncio.get_event_loop()
+        self._clock = LiveClock(loop=self._loop)  # Timers run on the event loop
         self.created_time = self._clock.utc_now()
+        self._created_monotonic_ns = self._clock.monotonic_ns()
         self._uuid_factory = UUIDFactory()
-        self._loop = asyncio.get_event_loop()
         self._executor = concurrent.futures.ThreadPoolExecutor()
         self._loop.set_default_executor(self._executor)
         self._is_running = False
@@ -194,7 +195,10 @@ class TradingNode:
             self.trader.load()
 
         self._log.info("state=INITIALIZED.")
-        self.time_to_initialize = self._clock.delta(self.created_time)
+        # Measured on the monotonic clock so unaffected by system clock adjustments
+        self.time_to_initialize = timedelta(
+            microseconds=(self._clock.monotonic_ns() - self._created_monotonic_ns) // 1000,
+        )
         self._log.info(f"Initialized in {self.time_to_initialize.total_seconds():.3f}s.")
 
     @property
@@ -44,10 +44,18 @@ cdef class Identifier:
 
         self.value = value
 
-    def __eq__(self, Identifier other) -> bool:
-        return self._is_subclass(type(other)) and self.value == other.value
-
-    def __ne__(self, Identifier other) -> bool:
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Identifier):
+            # Allows mixed str and identifier keys in the same dict or set,
+            # which share a hash, to be compared without a TypeError.
+            return NotImplemented
+        return self._is_subclass(type(other)) and self.value == (<Identifier>other).value
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, Identifier):
+            return NotImplemented
         return not self == other
 
     def __lt__(self, Identifier other) -> bool:
@@ -63,7 +71,10 @@ cdef class Identifier:
         return self.value >= other.value
 
     def __hash__(self) -> int:
-        return hash((type(self), self.value))
+        # The str caches its own hash so no tuple is built per call, and
+        # equal identifiers of related types (e.g. Venue and Exchange) now
+        # also hash equal.
+        return hash(self.value)
 
     def __str__(self) -> str:
         return self.value
@@ -15,6 +15,7 @@
 
 from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.analysis.reports cimport ReportProvider
+from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.execution.engine cimport ExecutionEngine
@@ -51,3 +52,5 @@ cdef class Trader(Component):
     cpdef object generate_order_fills_report(self)
     cpdef object generate_positions_report(self)
     cpdef object generate_account_report(self, Venue venue)
+
+    cdef Clock _create_strategy_clock(self)
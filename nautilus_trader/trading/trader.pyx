@@ -25,6 +25,7 @@ from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.analysis.reports cimport ReportProvider
 from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -224,7 +225,7 @@ cdef class Trader(Component):
             # Wire trader into strategy
             strategy.register_trader(
                 self.id,
-                self._clock.__class__(),  # Clock per strategy
+                self._create_strategy_clock(),  # Clock per strategy
                 self._log.get_logger(),
                 order_id_count=len(order_ids),
             )
@@ -297,3 +298,9 @@ cdef class Trader(Component):
 
         """
         return self._report_provider.generate_account_report(self._exec_engine.cache.account_for_venue(venue))
+
+    cdef Clock _create_strategy_clock(self):
+        if isinstance(self._clock, LiveClock):
+            # Strategy timers run on the same event loop as the trader (if any)
+            return LiveClock(loop=(<LiveClock>self._clock).get_event_loop())
+        return self._clock.__class__()
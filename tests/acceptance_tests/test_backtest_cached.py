@@ -132,8 +132,8 @@ class BacktestAcceptanceTestsUSDJPYWithBars(unittest.TestCase):
             extra_id_tag='002',
         )
 
-        # Note since these strategies are operating on the same symbol as per
-        # the EMACross BUY/SELL logic they will be flattening each others positions.
+        # Note these strategies are operating on the same symbol, with each
+        # EMACross only flattening its own positions.
         # The purpose of the test is just to ensure multiple strategies can run together.
 
         # Act
@@ -143,7 +143,7 @@ class BacktestAcceptanceTestsUSDJPYWithBars(unittest.TestCase):
         self.assertEqual(2689, strategy1.fast_ema.count)
         self.assertEqual(2689, strategy2.fast_ema.count)
         self.assertEqual(115043, self.engine.iteration)
-        self.assertEqual(Money(994662.72, USD), self.engine.portfolio.account(self.venue).balance())
+        self.assertEqual(Money(992818.91, USD), self.engine.portfolio.account(self.venue).balance())
 
 
 class BacktestAcceptanceTestsGBPUSDWithBars(unittest.TestCase):
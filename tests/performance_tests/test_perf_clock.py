@@ -16,6 +16,8 @@
 from datetime import timedelta
 import unittest
 
+import pandas as pd
+
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
 from tests.test_kit.performance import PerformanceHarness
@@ -24,6 +26,7 @@ from tests.test_kit.stubs import UNIX_EPOCH
 
 live_clock = LiveClock()
 test_clock = TestClock()
+backtest_clock = TestClock(pd.Timestamp("2020-01-01", tz="UTC"))
 
 
 class LiveClockPerformanceTests(unittest.TestCase):
@@ -31,12 +34,12 @@ class LiveClockPerformanceTests(unittest.TestCase):
     @staticmethod
     def test_utc_now():
         PerformanceHarness.profile_function(live_clock.utc_now, 100000, 1)
-        # ~0.0ms / ~1.4μs / 1385ns minimum of 100,000 runs @ 1 iteration each run.
+        # ~0.0ms / ~0.2μs / 179ns minimum of 100,000 runs @ 1 iteration each run.
 
     @staticmethod
     def test_unix_time():
         PerformanceHarness.profile_function(live_clock.unix_time, 100000, 1)
-        # ~0.0ms / ~0.1μs / 103ns minimum of 100,000 runs @ 1 iteration each run.
+        # ~0.0ms / ~0.1μs / 118ns minimum of 100,000 runs @ 1 iteration each run.
 
 
 class TestClockHarness:
@@ -45,6 +48,13 @@ class TestClockHarness:
     def advance_time():
         test_clock.advance_time(UNIX_EPOCH)
 
+    @staticmethod
+    def set_time_and_advance_time_with_timestamp():
+        # As called per tick by the backtest engine with pd.Timestamp values
+        to_time = backtest_clock.utc_now()
+        backtest_clock.set_time(to_time)
+        backtest_clock.advance_time(to_time)
+
     @staticmethod
     def iteratively_advance_time():
         test_time = UNIX_EPOCH
@@ -58,7 +68,12 @@ class TestClockPerformanceTests(unittest.TestCase):
     @staticmethod
     def test_advance_time():
         PerformanceHarness.profile_function(TestClockHarness.advance_time, 100000, 1)
-        # ~0.0ms / ~0.2μs / 175ns minimum of 100,000 runs @ 1 iteration each run.
+        # ~0.0ms / ~0.2μs / 191ns minimum of 100,000 runs @ 1 iteration each run.
+
+    @staticmethod
+    def test_set_time_and_advance_time_with_timestamp():
+        PerformanceHarness.profile_function(TestClockHarness.set_time_and_advance_time_with_timestamp, 100000, 1)
+        # ~0.0ms / ~0.4μs / 418ns minimum of 100,000 runs @ 1 iteration each run.
 
     @staticmethod
     def test_iteratively_advance_time():
@@ -67,4 +82,4 @@ class TestClockPerformanceTests(unittest.TestCase):
 
         iterations = 1
         PerformanceHarness.profile_function(TestClockHarness.iteratively_advance_time, 1, iterations)
-        # ~320.1ms minimum of 1 runs @ 1 iteration each run. (100000 advances)
+        # ~307.3ms minimum of 1 runs @ 1 iteration each run. (100000 advances)
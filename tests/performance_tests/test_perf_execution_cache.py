@@ -0,0 +1,119 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.execution.cache import ExecutionCache
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestStubs.symbol_audusd()
+GBPUSD_SIM = TestStubs.symbol_gbpusd()
+
+ORDER_COUNT = 10_000
+STRATEGY_COUNT = 10
+
+
+class ExecutionCachePerformanceTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        clock = TestClock()
+        logger = TestLogger(clock, bypass_logging=True)
+        trader_id = TraderId("TESTER", "000")
+
+        database = BypassExecutionDatabase(trader_id=trader_id, logger=logger)
+        self.cache = ExecutionCache(database=database, logger=logger)
+
+        self.strategy_ids = [StrategyId("S", f"{i:03d}") for i in range(STRATEGY_COUNT)]
+        self.order_factories = [
+            OrderFactory(trader_id=trader_id, strategy_id=strategy_id, clock=clock)
+            for strategy_id in self.strategy_ids
+        ]
+
+        # Populate the cache across two symbols and all strategies, with
+        # every seventh order working and the rest initialized.
+        self.working_order = None
+        for i in range(ORDER_COUNT):
+            order = self.create_order(i)
+            self.cache.add_order(order, PositionId.null())
+            if i % 7 == 0:
+                TestStubs.submit_and_accept_order(order, self.cache)
+                self.working_order = order
+
+        self.orders_to_add = []
+
+    def create_order(self, i):
+        return self.order_factories[i % STRATEGY_COUNT].market(
+            AUDUSD_SIM if i % 2 == 0 else GBPUSD_SIM,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+    def add_order(self):
+        if not self.orders_to_add:
+            # Refilled in batches so the benchmark does not depend on the call
+            # count, only the refilling run is slower (the minimum is reported).
+            self.orders_to_add = [self.create_order(i) for i in range(ORDER_COUNT)]
+        self.cache.add_order(self.orders_to_add.pop(), PositionId.null())
+
+    def update_order(self):
+        self.cache.update_order(self.working_order)
+
+    def order_working_ids(self):
+        self.cache.order_working_ids()
+
+    def order_working_ids_for_symbol(self):
+        self.cache.order_working_ids(symbol=AUDUSD_SIM)
+
+    def order_working_ids_for_symbol_and_strategy(self):
+        self.cache.order_working_ids(symbol=AUDUSD_SIM, strategy_id=self.strategy_ids[0])
+
+    def orders_working_for_symbol_and_strategy(self):
+        self.cache.orders_working(symbol=AUDUSD_SIM, strategy_id=self.strategy_ids[0])
+
+    def test_add_order(self):
+        PerformanceHarness.profile_function(self.add_order, ORDER_COUNT, 1)
+        # ~0.0ms / ~0.8μs / 774ns minimum of 10,000 runs @ 1 iteration each run.
+
+    def test_update_order(self):
+        PerformanceHarness.profile_function(self.update_order, 100000, 1)
+        # ~0.0ms / ~0.2μs / 240ns minimum of 100,000 runs @ 1 iteration each run.
+
+    def test_order_working_ids(self):
+        PerformanceHarness.profile_function(self.order_working_ids, 100000, 1)
+        # ~0.0ms / ~0.1μs / 114ns minimum of 100,000 runs @ 1 iteration each run.
+
+    def test_order_working_ids_for_symbol(self):
+        PerformanceHarness.profile_function(self.order_working_ids_for_symbol, 10000, 1)
+        # ~0.0ms / ~23.0μs / 22958ns minimum of 10,000 runs @ 1 iteration each run.
+
+    def test_order_working_ids_for_symbol_and_strategy(self):
+        PerformanceHarness.profile_function(self.order_working_ids_for_symbol_and_strategy, 10000, 1)
+        # ~0.0ms / ~10.3μs / 10337ns minimum of 10,000 runs @ 1 iteration each run.
+
+    def test_orders_working_for_symbol_and_strategy(self):
+        PerformanceHarness.profile_function(self.orders_working_for_symbol_and_strategy, 10000, 1)
+        # ~0.0ms / ~14.8μs / 14769ns minimum of 10,000 runs @ 1 iteration each run.
@@ -16,18 +16,40 @@
 import unittest
 import uuid
 
+from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.core.uuid import uuid4
 from tests.test_kit.performance import PerformanceHarness
 
 
+uuid_factory = UUIDFactory()
+
+
+class UUIDFactoryHarness:
+
+    @staticmethod
+    def generate_with_new_factory():
+        # As for a timer which only generates one or a few events
+        UUIDFactory().generate()
+
+
 class UUIDPerformanceTests(unittest.TestCase):
 
     @staticmethod
     def test_make_builtin_uuid():
         PerformanceHarness.profile_function(uuid.uuid4, 100000, 1)
-        # ~0.0ms / ~2.1μs / 2067ns minimum of 100,000 runs @ 1 iteration each run.
+        # ~0.0ms / ~1.7μs / 1707ns minimum of 100,000 runs @ 1 iteration each run.
 
     @staticmethod
     def test_make_nautilus_uuid():
         PerformanceHarness.profile_function(uuid4, 100000, 1)
-        # ~0.0ms / ~1.7μs / 1680ns minimum of 100,000 runs @ 1 iteration each run.
+        # ~0.0ms / ~1.5μs / 1518ns minimum of 100,000 runs @ 1 iteration each run.
+
+    @staticmethod
+    def test_factory_generate():
+        PerformanceHarness.profile_function(uuid_factory.generate, 100000, 1)
+        # ~0.0ms / ~1.1μs / 1129ns minimum of 100,000 runs @ 1 iteration each run.
+
+    @staticmethod
+    def test_new_factory_generate():
+        PerformanceHarness.profile_function(UUIDFactoryHarness.generate_with_new_factory, 100000, 1)
+        # ~0.0ms / ~1.2μs / 1159ns minimum of 100,000 runs @ 1 iteration each run.
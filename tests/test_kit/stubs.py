@@ -17,7 +17,7 @@ from datetime import datetime
 
 import pytz
 
-from nautilus_trader.core.uuid import uuid4
+from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.model.bar import Bar
 from nautilus_trader.model.bar import BarSpecification
 from nautilus_trader.model.bar import BarType
@@ -55,6 +55,12 @@ from nautilus_trader.model.tick import TradeTick
 # Unix epoch is the UTC time at 00:00:00 on 1/1/1970
 UNIX_EPOCH = datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
 
+ONE_MILLION_USD = Money(1_000_000, USD)
+ZERO_USD = Money(0, USD)
+
+# Generates event identifiers from batched random bytes
+UUID_FACTORY = UUIDFactory()
+
 
 class TestStubs:
 
@@ -212,11 +218,11 @@ class TestStubs:
 
         return AccountState(
             account_id,
-            [Money(1_000_000, USD)],
-            [Money(1_000_000, USD)],
-            [Money(1_000_000, USD)],
+            [ONE_MILLION_USD],
+            [ONE_MILLION_USD],
+            [ONE_MILLION_USD],
             {"default_currency": "USD"},
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -226,7 +232,7 @@ class TestStubs:
             TestStubs.account_id(),
             order.cl_ord_id,
             UNIX_EPOCH,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -239,7 +245,7 @@ class TestStubs:
             order.cl_ord_id,
             order_id,
             UNIX_EPOCH,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -250,7 +256,7 @@ class TestStubs:
             order.cl_ord_id,
             UNIX_EPOCH,
             "ORDER_REJECTED",
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -297,7 +303,7 @@ class TestStubs:
             commission=commission,
             liquidity_side=liquidity_side,
             execution_time=UNIX_EPOCH,
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -308,7 +314,7 @@ class TestStubs:
             order.cl_ord_id,
             order.id,
             UNIX_EPOCH,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -319,16 +325,28 @@ class TestStubs:
             order.cl_ord_id,
             order.id,
             UNIX_EPOCH,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
+    @staticmethod
+    def submit_and_accept_order(order, cache=None) -> None:
+        # Apply the submitted and accepted events, updating the given
+        # execution cache (if any) after each event as the engine would
+        order.apply(TestStubs.event_order_submitted(order))
+        if cache is not None:
+            cache.update_order(order)
+
+        order.apply(TestStubs.event_order_accepted(order))
+        if cache is not None:
+            cache.update_order(order)
+
     @staticmethod
     def event_position_opened(position) -> PositionOpened:
         return PositionOpened(
             position,
             position.last_event,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -337,7 +355,7 @@ class TestStubs:
         return PositionChanged(
             position,
             position.last_event,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
 
@@ -346,6 +364,6 @@ class TestStubs:
         return PositionClosed(
             position,
             position.last_event,
-            uuid4(),
+            UUID_FACTORY.generate(),
             UNIX_EPOCH,
         )
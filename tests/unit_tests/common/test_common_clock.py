@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 from datetime import datetime
 from datetime import timedelta
+import sys
+import threading
 import time
 import unittest
 
@@ -26,6 +29,13 @@ from nautilus_trader.common.timer import TimeEvent
 from tests.test_kit.stubs import UNIX_EPOCH
 
 
+def wait_until(condition, timeout_secs=2.0):
+    # Poll the condition so tests only wait as long as the timers take to fire
+    deadline = time.time() + timeout_secs
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+
+
 class TestClockTests(unittest.TestCase):
 
     def test_instantiate_has_expected_time_and_properties(self):
@@ -38,6 +48,27 @@ class TestClockTests(unittest.TestCase):
         self.assertEqual(init_time, clock.utc_now())
         self.assertTrue(clock.is_test_clock)
 
+    def test_timestamp_ns(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH + timedelta(seconds=1))
+
+        # Act
+        result = clock.timestamp_ns()
+
+        # Assert
+        self.assertEqual(1_000_000_000, result)
+
+    def test_monotonic_ns_advances_with_clock_time(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        start_ns = clock.monotonic_ns()
+
+        # Act
+        clock.advance_time(UNIX_EPOCH + timedelta(seconds=1))
+
+        # Assert
+        self.assertEqual(1_000_000_000, clock.monotonic_ns() - start_ns)
+
     def test_set_time_changes_time(self):
         # Arrange
         clock = TestClock(UNIX_EPOCH)
@@ -47,6 +78,7 @@ class TestClockTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
+        self.assertEqual(60_000_000_000, clock.timestamp_ns())
 
     def test_advance_time_changes_time_produces_empty_list(self):
         # Arrange
@@ -57,6 +89,7 @@ class TestClockTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
+        self.assertEqual(60_000_000_000, clock.timestamp_ns())
         self.assertEqual([], events)
 
     def test_advance_time_given_time_in_past_raises_value_error(self):
@@ -285,6 +318,84 @@ class TestClockTests(unittest.TestCase):
         self.assertEqual("TEST_TIMER2", clock.timer("TEST_TIMER2").name)
         self.assertEqual(2, clock.timer_count)
 
+    def test_advance_time_with_interleaved_timers_returns_events_in_chronological_order(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+
+        clock.set_timer("TEST_TIMER1", timedelta(seconds=30), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(seconds=20), handler=handler.append)
+        clock.set_time_alert("TEST_ALERT", UNIX_EPOCH + timedelta(seconds=50), handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(minutes=2))
+
+        # Assert
+        timestamps = [handler.event.timestamp for handler in event_handlers]
+        names = [handler.event.name for handler in event_handlers]
+        self.assertEqual(11, len(event_handlers))
+        self.assertEqual(sorted(timestamps), timestamps)
+        self.assertEqual(["TEST_TIMER2", "TEST_TIMER1", "TEST_TIMER2", "TEST_ALERT"], names[:4])
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], names[4:6])  # Stable for equal timestamps
+
+    def test_advance_time_only_advances_timers_which_are_due(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+
+        clock.set_timer("TEST_TIMER1", timedelta(seconds=10), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(minutes=10), handler=handler.append)
+
+        # Act
+        event_handlers = clock.advance_time(UNIX_EPOCH + timedelta(minutes=1))
+
+        # Assert
+        self.assertEqual(6, len(event_handlers))
+        self.assertTrue(all(handler.event.name == "TEST_TIMER1" for handler in event_handlers))
+        self.assertEqual(UNIX_EPOCH + timedelta(minutes=10), clock.timer("TEST_TIMER2").next_time)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=70), clock.next_event_time)
+
+    def test_advance_time_runs_returns_sorted_run_per_due_timer(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+
+        clock.set_timer("TEST_TIMER1", timedelta(seconds=30), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(seconds=20), handler=handler.append)
+        clock.set_timer("TEST_TIMER3", timedelta(minutes=10), handler=handler.append)
+
+        # Act
+        runs = clock.advance_time_runs(UNIX_EPOCH + timedelta(minutes=1))
+
+        # Assert
+        self.assertEqual(2, len(runs))
+        self.assertEqual(["TEST_TIMER1"] * 2, [handler.event.name for handler in runs[0]])
+        self.assertEqual(["TEST_TIMER2"] * 3, [handler.event.name for handler in runs[1]])
+        self.assertEqual(UNIX_EPOCH + timedelta(minutes=1), clock.utc_now())
+
+    def test_next_event_time_updated_when_timers_set_and_cancelled(self):
+        # Arrange
+        clock = TestClock(UNIX_EPOCH)
+        handler = []
+
+        # Act
+        clock.set_timer("TEST_TIMER1", timedelta(seconds=30), handler=handler.append)
+        clock.set_timer("TEST_TIMER2", timedelta(seconds=10), handler=handler.append)
+        clock.set_timer("TEST_TIMER3", timedelta(seconds=20), handler=handler.append)
+        next_after_set = clock.next_event_time
+        clock.cancel_timer("TEST_TIMER3")
+        next_after_cancel_other = clock.next_event_time
+        clock.cancel_timer("TEST_TIMER2")
+        next_after_cancel_next = clock.next_event_time
+        clock.cancel_timer("TEST_TIMER1")
+
+        # Assert
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=10), next_after_set)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=10), next_after_cancel_other)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=30), next_after_cancel_next)
+        self.assertIsNone(clock.next_event_time)
+        self.assertEqual(0, clock.next_event_time_ns)
+
 
 class LiveClockTests(unittest.TestCase):
     def setUp(self):
@@ -303,6 +414,7 @@ class LiveClockTests(unittest.TestCase):
         self.assertTrue(self.clock.is_default_handler_registered)
         self.assertFalse(self.clock.is_test_clock)
         self.assertEqual([], self.clock.timer_names())
+        self.assertIsNone(self.clock.get_event_loop())
 
     def test_utc_now(self):
         # Arrange
@@ -334,6 +446,40 @@ class LiveClockTests(unittest.TestCase):
         self.assertTrue(result > timedelta(0))
         self.assertEqual(timedelta, type(result))
 
+    def test_timestamp_ns(self):
+        # Arrange
+        # Act
+        result1 = self.clock.timestamp_ns()
+        result2 = self.clock.timestamp_ns()
+
+        # Assert
+        self.assertEqual(int, type(result1))
+        self.assertTrue(result1 > 0)
+        self.assertTrue(result2 >= result1)
+
+    def test_monotonic_ns(self):
+        # Arrange
+        start_ns = self.clock.monotonic_ns()
+
+        # Act
+        time.sleep(0.1)
+        result = self.clock.monotonic_ns() - start_ns
+
+        # Assert
+        self.assertEqual(int, type(start_ns))
+        self.assertTrue(result >= 100_000_000)
+
+    def test_utc_now_is_consistent_with_timestamp_ns(self):
+        # Arrange
+        start_ns = self.clock.timestamp_ns()
+
+        # Act
+        result = self.clock.utc_now()
+
+        # Assert
+        self.assertTrue(result >= UNIX_EPOCH + timedelta(microseconds=start_ns // 1000))
+        self.assertTrue(result - UNIX_EPOCH < timedelta(microseconds=start_ns // 1000 + 1_000_000))
+
     def test_unix_time(self):
         # Arrange
         # Act
@@ -351,7 +497,7 @@ class LiveClockTests(unittest.TestCase):
 
         # Act
         self.clock.set_time_alert(name, alert_time)
-        time.sleep(0.3)
+        wait_until(lambda: len(self.handler) >= 1)
 
         # Assert
         self.assertEqual(1, len(self.handler))
@@ -380,7 +526,7 @@ class LiveClockTests(unittest.TestCase):
         # Act
         self.clock.set_time_alert("TEST_ALERT1", alert_time1)
         self.clock.set_time_alert("TEST_ALERT2", alert_time2)
-        time.sleep(0.6)
+        wait_until(lambda: len(self.handler) >= 2)
 
         # Assert
         self.assertEqual([], self.clock.timer_names())
@@ -400,7 +546,7 @@ class LiveClockTests(unittest.TestCase):
             stop_time=None,
         )
 
-        time.sleep(0.5)
+        wait_until(lambda: len(self.handler) >= 1)
 
         # Assert
         self.assertEqual([name], self.clock.timer_names())
@@ -420,7 +566,7 @@ class LiveClockTests(unittest.TestCase):
             stop_time=None,
         )
 
-        time.sleep(0.5)
+        wait_until(lambda: len(self.handler) >= 2)
 
         # Assert
         self.assertEqual([name], self.clock.timer_names())
@@ -442,7 +588,7 @@ class LiveClockTests(unittest.TestCase):
             stop_time=stop_time,
         )
 
-        time.sleep(0.5)
+        wait_until(lambda: len(self.handler) >= 1 and not self.clock.timer_names())
 
         # Assert
         self.assertEqual([], self.clock.timer_names())
@@ -465,6 +611,64 @@ class LiveClockTests(unittest.TestCase):
         self.assertEqual([], self.clock.timer_names())
         self.assertTrue(len(self.handler) <= 4)
 
+    def test_cancel_timer_while_handler_is_running_does_not_block(self):
+        # Arrange
+        handler_started = threading.Event()
+        handler_release = threading.Event()
+
+        def blocking_handler(event):
+            handler_started.set()
+            handler_release.wait(timeout=2.0)
+
+        self.clock.set_timer(
+            name="TEST_TIMER",
+            interval=timedelta(milliseconds=100),
+            handler=blocking_handler,
+        )
+        handler_started.wait(timeout=2.0)
+
+        # Act
+        start = time.time()
+        self.clock.cancel_timer("TEST_TIMER")
+        duration = time.time() - start
+        handler_release.set()
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertTrue(duration < 1.0)
+
+    def test_handler_exception_does_not_stop_other_timers(self):
+        # Arrange
+        errors = []
+        excepthook = sys.excepthook
+        sys.excepthook = lambda ex_type, ex, tb: errors.append(ex)
+
+        def raising_handler(event):
+            raise RuntimeError("handler failed")
+
+        try:
+            self.clock.set_timer(
+                name="TEST_TIMER1",
+                interval=timedelta(milliseconds=50),
+            )
+            self.clock.set_timer(
+                name="TEST_TIMER2",
+                interval=timedelta(milliseconds=100),
+                handler=raising_handler,
+            )
+
+            # Act
+            wait_until(lambda: len(errors) >= 1)
+            count = len(self.handler)
+            wait_until(lambda: len(self.handler) >= count + 3)
+        finally:
+            sys.excepthook = excepthook
+
+        # Assert
+        self.assertIsInstance(errors[0], RuntimeError)
+        self.assertTrue(len(self.handler) >= count + 3)
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], sorted(self.clock.timer_names()))
+
     def test_set_repeating_timer(self):
         # Arrange
         name = "TEST_TIMER"
@@ -479,7 +683,7 @@ class LiveClockTests(unittest.TestCase):
             stop_time=None,
         )
 
-        time.sleep(0.5)
+        wait_until(lambda: len(self.handler) >= 3)
 
         # Assert
         self.assertTrue(len(self.handler) >= 3)
@@ -529,7 +733,125 @@ class LiveClockTests(unittest.TestCase):
             stop_time=None,
         )
 
-        time.sleep(0.9)
+        wait_until(lambda: len(self.handler) >= 8)
+
+        # Assert
+        self.assertTrue(len(self.handler) >= 8)
+
+
+class LiveClockWithLoopTests(unittest.TestCase):
+    def setUp(self):
+        # Fixture Setup
+        self.loop = asyncio.new_event_loop()
+        self.handler = []
+        self.clock = LiveClock(loop=self.loop)
+        self.clock.register_default_handler(self.handler.append)
+
+    def tearDown(self):
+        self.clock.cancel_timers()
+        self.loop.close()
+
+    def test_get_event_loop(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(self.loop, self.clock.get_event_loop())
+
+    def test_set_time_alert(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT", alert_time)
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(1, len(self.handler))
+        self.assertTrue(isinstance(self.handler[0], TimeEvent))
+
+    def test_set_two_repeating_timers(self):
+        # Arrange
+        interval = timedelta(milliseconds=100)
+        start_time = self.clock.utc_now()
+
+        # Act
+        self.clock.set_timer("TEST_TIMER1", interval=interval, start_time=start_time)
+        self.clock.set_timer("TEST_TIMER2", interval=interval, start_time=start_time)
+        self.loop.run_until_complete(asyncio.sleep(0.55))
 
         # Assert
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], self.clock.timer_names())
         self.assertTrue(len(self.handler) >= 8)
+
+    def test_set_and_cancel_timer_from_another_thread(self):
+        # Arrange
+        loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        loop_thread.start()
+
+        try:
+            # Act
+            self.clock.set_timer("TEST_TIMER", interval=timedelta(milliseconds=50))
+            wait_until(lambda: len(self.handler) >= 2)
+            self.clock.cancel_timer("TEST_TIMER")
+            time.sleep(0.1)  # Allow the cancellation to reach the loop
+            events_at_cancel = len(self.handler)
+            time.sleep(0.2)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            loop_thread.join()
+
+        # Assert
+        self.assertTrue(events_at_cancel >= 2)
+        self.assertEqual(events_at_cancel, len(self.handler))
+        self.assertEqual(0, self.clock.timer_count)
+
+    def test_cancel_timer_after_loop_closed(self):
+        # Arrange
+        self.clock.set_timer("TEST_TIMER", interval=timedelta(milliseconds=100))
+        self.loop.run_until_complete(asyncio.sleep(0.15))
+        self.loop.close()
+
+        # Act
+        self.clock.cancel_timer("TEST_TIMER")
+
+        # Assert
+        self.assertEqual(0, self.clock.timer_count)
+
+    def test_handler_exception_does_not_drop_other_events_in_batch(self):
+        # Arrange
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context["exception"]))
+        received = []
+
+        def raising_handler(event):
+            received.append(event.name)
+            raise RuntimeError("handler failed")
+
+        interval = timedelta(milliseconds=100)
+        start_time = self.clock.utc_now()
+
+        # Act
+        self.clock.set_timer("TEST_TIMER1", interval=interval, start_time=start_time, handler=raising_handler)
+        self.clock.set_timer("TEST_TIMER2", interval=interval, start_time=start_time, handler=raising_handler)
+        self.loop.run_until_complete(asyncio.sleep(0.35))
+
+        # Assert
+        self.assertTrue(received.count("TEST_TIMER1") >= 2)
+        self.assertEqual(received.count("TEST_TIMER1"), received.count("TEST_TIMER2"))
+        self.assertEqual(len(received), len(errors))
+        self.assertEqual(["TEST_TIMER1", "TEST_TIMER2"], self.clock.timer_names())
+
+    def test_cancel_timer(self):
+        # Arrange
+        self.clock.set_timer("TEST_TIMER", interval=timedelta(milliseconds=100))
+        self.loop.run_until_complete(asyncio.sleep(0.25))
+
+        # Act
+        self.clock.cancel_timer("TEST_TIMER")
+        event_count = len(self.handler)
+        self.loop.run_until_complete(asyncio.sleep(0.25))
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(event_count, len(self.handler))
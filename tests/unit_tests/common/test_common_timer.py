@@ -16,6 +16,7 @@
 from datetime import timedelta
 import unittest
 
+from nautilus_trader.common.timer import TestTimer
 from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.common.timer import TimeEventHandler
 from nautilus_trader.common.timer import Timer
@@ -37,6 +38,17 @@ class TimeEventTests(unittest.TestCase):
         self.assertTrue(event1 == event2)
         self.assertTrue(event1 != event3)
 
+    def test_hash(self):
+        # Arrange
+        event1 = TimeEvent("EVENT_1", uuid4(), UNIX_EPOCH)
+        event2 = TimeEvent("EVENT_1", uuid4(), UNIX_EPOCH)
+
+        # Act
+        # Assert
+        self.assertEqual(int, type(hash(event1)))
+        self.assertEqual(hash(event1), hash(event2))  # Consistent with equality
+        self.assertEqual(1, len({event1, event2}))
+
     def test_str_repr(self):
         # Arrange
         uuid = uuid4()
@@ -145,6 +157,64 @@ class TimerTests(unittest.TestCase):
         self.assertEqual(int, type(hash(timer)))
         self.assertEqual(hash(timer), hash(timer))
 
+    def test_instantiate_has_expected_nanosecond_times(self):
+        # Arrange
+        receiver = []
+
+        # Act
+        timer = Timer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(milliseconds=100),
+            UNIX_EPOCH + timedelta(seconds=1),
+        )
+
+        # Assert
+        self.assertEqual(100_000_000, timer.interval_ns)
+        self.assertEqual(1_100_000_000, timer.next_time_ns)
+
+    def test_instantiate_with_non_positive_interval_raises_value_error(self):
+        # Arrange
+        receiver = []
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, Timer, "TIMER_1", receiver.append, timedelta(0), UNIX_EPOCH)
+        self.assertRaises(ValueError, Timer, "TIMER_1", receiver.append, timedelta(-1), UNIX_EPOCH)
+
+    def test_instantiate_with_stop_time_before_first_interval_raises_value_error(self):
+        # Arrange
+        receiver = []
+
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            Timer,
+            "TIMER_1",
+            receiver.append,
+            timedelta(seconds=1),
+            UNIX_EPOCH,
+            UNIX_EPOCH + timedelta(milliseconds=999),
+        )
+
+    def test_iterate_next_time_increments_nanosecond_time(self):
+        # Arrange
+        receiver = []
+        timer = Timer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(milliseconds=100),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        timer.iterate_next_time(UNIX_EPOCH)
+
+        # Assert
+        self.assertEqual(UNIX_EPOCH + timedelta(milliseconds=200), timer.next_time)
+        self.assertEqual(200_000_000, timer.next_time_ns)
+
     def test_cancel_when_not_overridden_raises_not_implemented_error(self):
         # Arrange
         receiver = []
@@ -158,3 +228,64 @@ class TimerTests(unittest.TestCase):
         # Act
         # Assert
         self.assertRaises(NotImplementedError, timer.cancel)
+
+
+class TestTimerTests(unittest.TestCase):
+
+    def test_advance_within_next_time_returns_no_events(self):
+        # Arrange
+        receiver = []
+        timer = TestTimer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(seconds=1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        events = timer.advance(999_999_999)
+
+        # Assert
+        self.assertEqual([], events)
+        self.assertEqual(1_000_000_000, timer.next_time_ns)
+
+    def test_advance_returns_events_at_each_interval(self):
+        # Arrange
+        receiver = []
+        timer = TestTimer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(seconds=1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        events = timer.advance(3_500_000_000)
+
+        # Assert
+        self.assertEqual(3, len(events))
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=1), events[0].timestamp)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=3), events[2].timestamp)
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=4), timer.next_time)
+        self.assertEqual(4_000_000_000, timer.next_time_ns)
+        self.assertFalse(timer.expired)
+
+    def test_advance_beyond_stop_time_expires_timer(self):
+        # Arrange
+        receiver = []
+        timer = TestTimer(
+            "TIMER_1",
+            receiver.append,
+            timedelta(seconds=1),
+            UNIX_EPOCH,
+            UNIX_EPOCH + timedelta(seconds=2, milliseconds=500),
+        )
+
+        # Act
+        events = timer.advance(10_000_000_000)
+
+        # Assert
+        self.assertEqual(3, len(events))
+        self.assertEqual(UNIX_EPOCH + timedelta(seconds=3), events[-1].timestamp)
+        self.assertTrue(timer.expired)
+        self.assertEqual([], timer.advance(20_000_000_000))
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
 import unittest
 
 from nautilus_trader.common.uuid import UUIDFactory
@@ -33,3 +34,46 @@ class UUIDFactoryTests(unittest.TestCase):
         self.assertEqual(UUID, type(result1))
         self.assertNotEqual(result1, result2)
         self.assertNotEqual(result2, result3)
+
+    def test_factory_returns_unique_uuids_across_batches(self):
+        # Arrange
+        factory = UUIDFactory()
+
+        # Act
+        result = {factory.generate() for _ in range(1000)}
+
+        # Assert
+        self.assertEqual(1000, len(result))
+
+    def test_factories_share_buffer_and_return_unique_uuids(self):
+        # Arrange
+        factories = [UUIDFactory() for _ in range(100)]
+
+        # Act
+        result = {factory.generate() for factory in factories for _ in range(10)}
+
+        # Assert
+        self.assertEqual(1000, len(result))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_factory_returns_different_uuids_in_forked_child(self):
+        # Arrange
+        factory = UUIDFactory()
+        factory.generate()  # Fill the buffer before forking
+        read_fd, write_fd = os.pipe()
+
+        # Act
+        pid = os.fork()
+        if pid == 0:  # Child
+            os.close(read_fd)
+            os.write(write_fd, factory.generate().value.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_value = pipe.read()
+        os.waitpid(pid, 0)
+        parent_value = factory.generate().value
+
+        # Assert
+        self.assertNotEqual(parent_value, child_value)
@@ -23,11 +23,14 @@ import pytz
 
 from nautilus_trader.core.datetime import as_utc_index
 from nautilus_trader.core.datetime import as_utc_timestamp
+from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.core.datetime import format_iso8601
 from nautilus_trader.core.datetime import from_posix_ms
 from nautilus_trader.core.datetime import is_datetime_utc
 from nautilus_trader.core.datetime import is_tz_aware
 from nautilus_trader.core.datetime import is_tz_naive
+from nautilus_trader.core.datetime import nanos_to_unix_dt
+from nautilus_trader.core.datetime import timedelta_to_nanos
 from nautilus_trader.core.datetime import to_posix_ms
 from tests.test_kit.stubs import UNIX_EPOCH
 
@@ -62,6 +65,51 @@ class TestFunctionsTests(unittest.TestCase):
         # Assert
         self.assertEqual(expected, dt)
 
+    @parameterized.expand([
+        [timedelta(0), 0],
+        [timedelta(microseconds=1), 1000],
+        [timedelta(milliseconds=100), 100000000],
+        [timedelta(days=1, seconds=1), 86401000000000],
+        [timedelta(minutes=-1), -60000000000],
+    ])
+    def test_timedelta_to_nanos_with_various_values_returns_expected_int(self, value, expected):
+        # Arrange
+        # Act
+        nanos = timedelta_to_nanos(value)
+
+        # Assert
+        self.assertEqual(expected, nanos)
+
+    @parameterized.expand([
+        [datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc), -2674800000000000],
+        [datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc), 0],
+        [datetime(2013, 1, 1, 1, 0, tzinfo=pytz.utc), 1357002000000000000],
+        [datetime(2020, 1, 2, 3, 2, microsecond=1, tzinfo=pytz.utc), 1577934120000001000],
+        [pd.Timestamp("2020-01-02 03:02:00.000001", tz="UTC"), 1577934120000001000],
+        [pd.Timestamp("2020-01-02 03:02:00.000001999", tz="UTC"), 1577934120000001999],
+    ])
+    def test_dt_to_unix_nanos_with_various_values_returns_expected_int(self, value, expected):
+        # Arrange
+        # Act
+        nanos = dt_to_unix_nanos(value)
+
+        # Assert
+        self.assertEqual(expected, nanos)
+
+    @parameterized.expand([
+        [-2674800000000000, datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc)],
+        [-1, datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=pytz.utc)],
+        [0, datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc)],
+        [1577934120000001999, datetime(2020, 1, 2, 3, 2, 0, 1, tzinfo=pytz.utc)],
+    ])
+    def test_nanos_to_unix_dt_with_various_values_returns_expected_datetime(self, value, expected):
+        # Arrange
+        # Act
+        dt = nanos_to_unix_dt(value)
+
+        # Assert
+        self.assertEqual(expected, dt)
+
     def test_is_datetime_utc_given_tz_naive_datetime_returns_false(self):
         # Arrange
         dt = datetime(2013, 1, 1, 1, 0)
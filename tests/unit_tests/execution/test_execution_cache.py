@@ -50,26 +50,69 @@ from tests.test_kit.stubs import TestStubs
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_audusd())
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy(TestStubs.symbol_gbpusd())
 
+# Immutable value objects shared across tests
+QTY_100K = Quantity(100000)
+PRICE_1_00000 = Price("1.00000")
+PRICE_1_00001 = Price("1.00001")
+POSITION_ID_1 = PositionId("P-1")
+POSITION_ID_2 = PositionId("P-2")
+
 
 class ExecutionCacheTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # The strategy is only used as an order factory here, so one
+        # registered instance is shared and reset per test.
+        cls.clock = TestClock()
+        cls.logger = TestLogger(cls.clock, bypass_logging=True)
+
+        cls.strategy = TradingStrategy(order_id_tag="001")
+        cls.strategy.register_trader(
+            TraderId("TESTER", "000"),
+            cls.clock,
+            cls.logger,
+        )
+
     def setUp(self):
         # Fixture Setup
-        clock = TestClock()
-        logger = TestLogger(clock)
-
         self.trader_id = TraderId("TESTER", "000")
         self.account_id = TestStubs.account_id()
 
-        self.strategy = TradingStrategy(order_id_tag="001")
-        self.strategy.register_trader(
-            TraderId("TESTER", "000"),
-            clock,
-            logger,
-        )
-
-        exec_db = BypassExecutionDatabase(trader_id=self.trader_id, logger=logger)
-        self.cache = ExecutionCache(database=exec_db, logger=logger)
+        self.strategy.reset()
+
+        exec_db = BypassExecutionDatabase(trader_id=self.trader_id, logger=self.logger)
+        self.cache = ExecutionCache(database=exec_db, logger=self.logger)
+
+    def _assert_position_queries(self, position, is_open):
+        # Query the open and closed positions once for each filter combination,
+        # including filters which match nothing while the position exists.
+        other_strategy_id = StrategyId("S", "ZX1")
+        filters = [
+            (None, None, True),
+            (position.symbol, None, True),
+            (None, self.strategy.id, True),
+            (position.symbol, self.strategy.id, True),
+            (GBPUSD_SIM.symbol, None, False),
+            (None, other_strategy_id, False),
+            (position.symbol, other_strategy_id, False),
+            (GBPUSD_SIM.symbol, other_strategy_id, False),
+        ]
+
+        for symbol, strategy_id, matches in filters:
+            with self.subTest(symbol=symbol, strategy_id=strategy_id):
+                positions_open = self.cache.positions_open(symbol=symbol, strategy_id=strategy_id)
+                positions_closed = self.cache.positions_closed(symbol=symbol, strategy_id=strategy_id)
+
+                if matches and is_open:
+                    self.assertIn(position, positions_open)
+                else:
+                    self.assertNotIn(position, positions_open)
+
+                if matches and not is_open:
+                    self.assertIn(position, positions_closed)
+                else:
+                    self.assertNotIn(position, positions_closed)
 
     def test_cache_accounts_with_no_accounts(self):
         # Arrange
@@ -212,10 +255,10 @@ class ExecutionCacheTests(unittest.TestCase):
         order = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
 
         # Act
         self.cache.add_order(order, position_id)
@@ -230,15 +273,34 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertEqual(OrderId.null(), self.cache.order_id(order.cl_ord_id))
         self.assertIsNone(self.cache.cl_ord_id(order.id))
 
+    def test_order_ids_with_filters_returns_new_set(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            QTY_100K,
+        )
+
+        self.cache.add_order(order, PositionId.null())
+
+        # Act
+        result = self.cache.order_active_ids(symbol=order.symbol, strategy_id=self.strategy.id)
+        result.clear()
+
+        # Assert
+        self.assertEqual(set(), self.cache.order_active_ids(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual(set(), self.cache.order_active_ids(symbol=order.symbol, strategy_id=StrategyId("S", "ZX1")))
+        self.assertEqual({order.cl_ord_id}, self.cache.order_active_ids(symbol=order.symbol, strategy_id=self.strategy.id))
+
     def test_load_order(self):
         # Arrange
         order = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order, position_id)
 
         # Act
@@ -252,17 +314,17 @@ class ExecutionCacheTests(unittest.TestCase):
         order = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order, position_id)
 
         order_filled = TestStubs.event_order_filled(
             order,
             instrument=AUDUSD_SIM,
-            position_id=PositionId('P-1'),
-            fill_price=Price("1.00000"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00000,
         )
 
         position = Position(order_filled)
@@ -274,31 +336,55 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertTrue(self.cache.position_exists(position.id))
         self.assertIn(position.id, self.cache.position_ids())
         self.assertIn(position, self.cache.positions())
-        self.assertIn(position, self.cache.positions_open())
-        self.assertIn(position, self.cache.positions_open(symbol=position.symbol))
-        self.assertIn(position, self.cache.positions_open(strategy_id=self.strategy.id))
-        self.assertIn(position, self.cache.positions_open(symbol=position.symbol, strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_closed())
-        self.assertNotIn(position, self.cache.positions_closed(symbol=position.symbol))
-        self.assertNotIn(position, self.cache.positions_closed(strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_closed(symbol=position.symbol, strategy_id=self.strategy.id))
+        self._assert_position_queries(position, is_open=True)
+
+    def test_position_open_ids_when_filters_match_nothing_returns_empty_set(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            QTY_100K,
+        )
+
+        self.cache.add_order(order, POSITION_ID_1)
+
+        order_filled = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00000,
+        )
+
+        position = Position(order_filled)
+        other_strategy_id = StrategyId("S", "ZX1")
+
+        # Act
+        self.cache.add_position(position)
+
+        # Assert
+        self.assertEqual({position.id}, self.cache.position_open_ids())
+        self.assertEqual(set(), self.cache.position_open_ids(symbol=GBPUSD_SIM.symbol))
+        self.assertEqual(set(), self.cache.position_open_ids(strategy_id=other_strategy_id))
+        self.assertEqual(set(), self.cache.position_open_ids(symbol=GBPUSD_SIM.symbol, strategy_id=other_strategy_id))
+        self.assertEqual([], self.cache.positions_open(symbol=AUDUSD_SIM.symbol, strategy_id=other_strategy_id))
+        self.assertEqual(0, self.cache.positions_open_count(strategy_id=other_strategy_id))
 
     def test_load_position(self):
         # Arrange
         order = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order, position_id)
 
         order_filled = TestStubs.event_order_filled(
             order,
             instrument=AUDUSD_SIM,
-            position_id=PositionId('P-1'),
-            fill_price=Price("1.00000"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00000,
         )
 
         position = Position(order_filled)
@@ -315,11 +401,11 @@ class ExecutionCacheTests(unittest.TestCase):
         order = self.strategy.order_factory.stop_market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
-            Price("1.00000"),
+            QTY_100K,
+            PRICE_1_00000,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order, position_id)
 
         order.apply(TestStubs.event_order_submitted(order))
@@ -356,21 +442,17 @@ class ExecutionCacheTests(unittest.TestCase):
         order = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order, position_id)
-        order.apply(TestStubs.event_order_submitted(order))
-        self.cache.update_order(order)
-
-        order.apply(TestStubs.event_order_accepted(order))
-        self.cache.update_order(order)
+        TestStubs.submit_and_accept_order(order, self.cache)
 
         order.apply(TestStubs.event_order_filled(
             order,
             instrument=AUDUSD_SIM,
-            fill_price=Price("1.00001")),
+            fill_price=PRICE_1_00001),
         )
 
         # Act
@@ -403,21 +485,17 @@ class ExecutionCacheTests(unittest.TestCase):
         order1 = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order1, position_id)
-        order1.apply(TestStubs.event_order_submitted(order1))
-        self.cache.update_order(order1)
-
-        order1.apply(TestStubs.event_order_accepted(order1))
-        self.cache.update_order(order1)
+        TestStubs.submit_and_accept_order(order1, self.cache)
         order1_filled = TestStubs.event_order_filled(
             order1,
             instrument=AUDUSD_SIM,
-            position_id=PositionId('P-1'),
-            fill_price=Price("1.00001"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00001,
         )
 
         position = Position(order1_filled)
@@ -429,14 +507,7 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertTrue(self.cache.position_exists(position.id))
         self.assertIn(position.id, self.cache.position_ids())
         self.assertIn(position, self.cache.positions())
-        self.assertIn(position, self.cache.positions_open())
-        self.assertIn(position, self.cache.positions_open(symbol=position.symbol))
-        self.assertIn(position, self.cache.positions_open(strategy_id=self.strategy.id))
-        self.assertIn(position, self.cache.positions_open(symbol=position.symbol, strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_closed())
-        self.assertNotIn(position, self.cache.positions_closed(symbol=position.symbol))
-        self.assertNotIn(position, self.cache.positions_closed(strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_closed(symbol=position.symbol, strategy_id=self.strategy.id))
+        self._assert_position_queries(position, is_open=True)
         self.assertEqual(position, self.cache.position(position_id))
         self.assertEqual(1, self.cache.positions_open_count())
         self.assertEqual(0, self.cache.positions_closed_count())
@@ -447,21 +518,17 @@ class ExecutionCacheTests(unittest.TestCase):
         order1 = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position_id = PositionId('P-1')
+        position_id = POSITION_ID_1
         self.cache.add_order(order1, position_id)
-        order1.apply(TestStubs.event_order_submitted(order1))
-        self.cache.update_order(order1)
-
-        order1.apply(TestStubs.event_order_accepted(order1))
-        self.cache.update_order(order1)
+        TestStubs.submit_and_accept_order(order1, self.cache)
         order1_filled = TestStubs.event_order_filled(
             order1,
             instrument=AUDUSD_SIM,
-            position_id=PositionId('P-1'),
-            fill_price=Price("1.00001"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00001,
         )
 
         position = Position(order1_filled)
@@ -470,19 +537,15 @@ class ExecutionCacheTests(unittest.TestCase):
         order2 = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.SELL,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        order2.apply(TestStubs.event_order_submitted(order2))
-        self.cache.update_order(order2)
-
-        order2.apply(TestStubs.event_order_accepted(order2))
-        self.cache.update_order(order2)
+        TestStubs.submit_and_accept_order(order2, self.cache)
         order2_filled = TestStubs.event_order_filled(
             order2,
             instrument=AUDUSD_SIM,
-            position_id=PositionId('P-1'),
-            fill_price=Price("1.00001"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00001,
         )
 
         position.apply(order2_filled)
@@ -494,19 +557,71 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertTrue(self.cache.position_exists(position.id))
         self.assertIn(position.id, self.cache.position_ids())
         self.assertIn(position, self.cache.positions())
-        self.assertIn(position, self.cache.positions_closed())
-        self.assertIn(position, self.cache.positions_closed(symbol=position.symbol))
-        self.assertIn(position, self.cache.positions_closed(strategy_id=self.strategy.id))
-        self.assertIn(position, self.cache.positions_closed(symbol=position.symbol, strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_open())
-        self.assertNotIn(position, self.cache.positions_open(symbol=position.symbol))
-        self.assertNotIn(position, self.cache.positions_open(strategy_id=self.strategy.id))
-        self.assertNotIn(position, self.cache.positions_open(symbol=position.symbol, strategy_id=self.strategy.id))
+        self._assert_position_queries(position, is_open=False)
         self.assertEqual(position, self.cache.position(position_id))
         self.assertEqual(0, self.cache.positions_open_count())
         self.assertEqual(1, self.cache.positions_closed_count())
         self.assertEqual(1, self.cache.positions_total_count())
 
+    def test_update_position_for_reopened_position(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            QTY_100K,
+        )
+
+        position_id = POSITION_ID_1
+        self.cache.add_order(order1, position_id)
+        TestStubs.submit_and_accept_order(order1)
+        order1_filled = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            fill_price=PRICE_1_00001,
+        )
+
+        position = Position(order1_filled)
+        self.cache.add_position(position)
+
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.SELL,
+            QTY_100K,
+        )
+
+        TestStubs.submit_and_accept_order(order2)
+        position.apply(TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            fill_price=PRICE_1_00001,
+        ))
+        self.cache.update_position(position)
+
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.symbol,
+            OrderSide.BUY,
+            QTY_100K,
+        )
+
+        TestStubs.submit_and_accept_order(order3)
+        position.apply(TestStubs.event_order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=position_id,
+            fill_price=PRICE_1_00001,
+        ))
+
+        # Act
+        self.cache.update_position(position)
+
+        # Assert
+        self.assertIn(position_id, self.cache.position_open_ids())
+        self.assertNotIn(position_id, self.cache.position_closed_ids())
+        self.assertEqual(1, self.cache.positions_open_count())
+        self.assertEqual(0, self.cache.positions_closed_count())
+
     def test_update_account(self):
         # Arrange
         event = TestStubs.event_account_state()
@@ -530,28 +645,22 @@ class ExecutionCacheTests(unittest.TestCase):
         # Assert
         self.assertNotIn(self.strategy.id, self.cache.strategy_ids())
 
-    def test_check_residuals(self):
-        # Arrange
+    def _add_filled_and_working_orders(self):
+        # Adds a filled order with its open position, and a working stop order
         order1 = self.strategy.order_factory.market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
+            QTY_100K,
         )
 
-        position1_id = PositionId('P-1')
-        self.cache.add_order(order1, position1_id)
-
-        order1.apply(TestStubs.event_order_submitted(order1))
-        self.cache.update_order(order1)
-
-        order1.apply(TestStubs.event_order_accepted(order1))
-        self.cache.update_order(order1)
+        self.cache.add_order(order1, POSITION_ID_1)
+        TestStubs.submit_and_accept_order(order1, self.cache)
 
         order1_filled = TestStubs.event_order_filled(
             order1,
             instrument=AUDUSD_SIM,
-            position_id=position1_id,
-            fill_price=Price("1.00000"),
+            position_id=POSITION_ID_1,
+            fill_price=PRICE_1_00000,
         )
 
         position1 = Position(order1_filled)
@@ -561,18 +670,16 @@ class ExecutionCacheTests(unittest.TestCase):
         order2 = self.strategy.order_factory.stop_market(
             AUDUSD_SIM.symbol,
             OrderSide.BUY,
-            Quantity(100000),
-            Price("1.0000"),
+            QTY_100K,
+            PRICE_1_00000,
         )
 
-        position2_id = PositionId('P-2')
-        self.cache.add_order(order2, position2_id)
+        self.cache.add_order(order2, POSITION_ID_2)
+        TestStubs.submit_and_accept_order(order2, self.cache)
 
-        order2.apply(TestStubs.event_order_submitted(order2))
-        self.cache.update_order(order2)
-
-        order2.apply(TestStubs.event_order_accepted(order2))
-        self.cache.update_order(order2)
+    def test_check_residuals(self):
+        # Arrange
+        self._add_filled_and_working_orders()
 
         # Act
         self.cache.check_residuals()
@@ -582,48 +689,7 @@ class ExecutionCacheTests(unittest.TestCase):
 
     def test_reset(self):
         # Arrange
-        order1 = self.strategy.order_factory.market(
-            AUDUSD_SIM.symbol,
-            OrderSide.BUY,
-            Quantity(100000),
-        )
-
-        position1_id = PositionId('P-1')
-        self.cache.add_order(order1, position1_id)
-
-        order1.apply(TestStubs.event_order_submitted(order1))
-        self.cache.update_order(order1)
-
-        order1.apply(TestStubs.event_order_accepted(order1))
-        self.cache.update_order(order1)
-
-        order1_filled = TestStubs.event_order_filled(
-            order1,
-            instrument=AUDUSD_SIM,
-            position_id=position1_id,
-            fill_price=Price("1.00000"),
-        )
-        position1 = Position(order1_filled)
-        self.cache.update_order(order1)
-        self.cache.add_position(position1)
-
-        order2 = self.strategy.order_factory.stop_market(
-            AUDUSD_SIM.symbol,
-            OrderSide.BUY,
-            Quantity(100000),
-            Price("1.00000"),
-        )
-
-        position2_id = PositionId('P-2')
-        self.cache.add_order(order2, position2_id)
-
-        order2.apply(TestStubs.event_order_submitted(order2))
-        self.cache.update_order(order2)
-
-        order2.apply(TestStubs.event_order_accepted(order2))
-        self.cache.update_order(order2)
-
-        self.cache.update_order(order2)
+        self._add_filled_and_working_orders()
 
         # Act
         self.cache.reset()
@@ -635,46 +701,7 @@ class ExecutionCacheTests(unittest.TestCase):
 
     def test_flush_db(self):
         # Arrange
-        order1 = self.strategy.order_factory.market(
-            AUDUSD_SIM.symbol,
-            OrderSide.BUY,
-            Quantity(100000),
-        )
-
-        position1_id = PositionId('P-1')
-        self.cache.add_order(order1, position1_id)
-
-        order1.apply(TestStubs.event_order_submitted(order1))
-        self.cache.update_order(order1)
-
-        order1.apply(TestStubs.event_order_accepted(order1))
-        self.cache.update_order(order1)
-
-        order1_filled = TestStubs.event_order_filled(
-            order1,
-            instrument=AUDUSD_SIM,
-            position_id=position1_id,
-            fill_price=Price("1.00000"),
-        )
-
-        position1 = Position(order1_filled)
-        self.cache.update_order(order1)
-        self.cache.add_position(position1)
-
-        order2 = self.strategy.order_factory.stop_market(
-            AUDUSD_SIM.symbol,
-            OrderSide.BUY,
-            Quantity(100000),
-            Price("1.00000"),
-        )
-
-        position2_id = PositionId('P-2')
-        self.cache.add_order(order2, position2_id)
-        order2.apply(TestStubs.event_order_submitted(order2))
-        self.cache.update_order(order2)
-
-        order2.apply(TestStubs.event_order_accepted(order2))
-        self.cache.update_order(order2)
+        self._add_filled_and_working_orders()
 
         # Act
         self.cache.reset()
@@ -686,14 +713,21 @@ class ExecutionCacheTests(unittest.TestCase):
 
 class ExecutionCacheIntegrityCheckTests(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Loaded once as parsing the CSV data dominates the fixture setup,
+        # copies are taken per test so every engine receives pristine data.
+        cls.usdjpy_1min_bid = TestDataProvider.usdjpy_1min_bid()
+        cls.usdjpy_1min_ask = TestDataProvider.usdjpy_1min_ask()
+
     def setUp(self):
         # Fixture Setup
         self.venue = Venue("SIM")
         self.usdjpy = TestInstrumentProvider.default_fx_ccy(Symbol("USD/JPY", self.venue))
         data = BacktestDataContainer()
         data.add_instrument(self.usdjpy)
-        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid())
-        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask())
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.BID, self.usdjpy_1min_bid.copy())
+        data.add_bars(self.usdjpy.symbol, BarAggregation.MINUTE, PriceType.ASK, self.usdjpy_1min_ask.copy())
 
         self.engine = BacktestEngine(
             data=data,
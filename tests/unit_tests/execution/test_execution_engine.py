@@ -562,7 +562,7 @@ class ExecutionEngineTests(unittest.TestCase):
         # Act
         self.exec_engine.process(TestStubs.event_order_submitted(order))
         self.exec_engine.process(TestStubs.event_order_accepted(order))
-        self.exec_engine.process(TestStubs.event_order_filled(order, AUDUSD_SIM, PositionId.null()))
+        self.exec_engine.process(TestStubs.event_order_filled(order, AUDUSD_SIM, PositionId.null(), strategy.id))
 
         expected_id = PositionId("P-19700101-000000-000-001-1")  # Generated inside engine
 
@@ -75,6 +75,7 @@ class IdentifierTests(unittest.TestCase):
         self.assertTrue(id1 != id3)
         self.assertTrue(id2 != id3)
         self.assertTrue(id2 != id4)
+        self.assertEqual(hash(id1), hash(id2))  # Consistent with equality
 
     def test_comparison(self):
         # Arrange
@@ -102,6 +103,21 @@ class IdentifierTests(unittest.TestCase):
         # Assert
         self.assertEqual(int, type(hash(identifier1)))
         self.assertEqual(hash(identifier1), hash(identifier2))
+        self.assertEqual(1, len({PositionId("P-1"), PositionId("P-1")}))
+
+    def test_mixed_str_and_identifier_lookups(self):
+        # Arrange
+        position_id = PositionId("P-1")
+
+        # Act
+        # Assert
+        self.assertFalse(position_id == "P-1")
+        self.assertTrue(position_id != "P-1")
+        self.assertFalse(position_id == None)  # noqa
+        self.assertNotIn("P-1", {position_id})
+        self.assertIsNone({position_id: 1}.get("P-1"))
+        self.assertIsNone({"P-1": 1}.get(position_id))
+        self.assertEqual(2, len({position_id, "P-1"}))
 
     def test_identifier_equality(self):
         # Arrange
@@ -18,7 +18,6 @@ import unittest
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.common.logging import TestLogger
-from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.data.cache import DataCache
 from nautilus_trader.model.currencies import BTC
 from nautilus_trader.model.currencies import ETH
@@ -30,7 +29,10 @@ from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.objects import Money
 from nautilus_trader.trading.account import Account
 from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit.stubs import ONE_MILLION_USD
 from tests.test_kit.stubs import UNIX_EPOCH
+from tests.test_kit.stubs import UUID_FACTORY
+from tests.test_kit.stubs import ZERO_USD
 
 
 class AccountTests(unittest.TestCase):
@@ -52,11 +54,11 @@ class AccountTests(unittest.TestCase):
         # Arrange
         event = AccountState(
             AccountId("SIM", "001"),
-            [Money(1_000_000, USD)],
-            [Money(1_000_000, USD)],
-            [Money(0, USD)],
+            [ONE_MILLION_USD],
+            [ONE_MILLION_USD],
+            [ZERO_USD],
             info={"default_currency": "USD"},  # Set the default currency
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -79,11 +81,11 @@ class AccountTests(unittest.TestCase):
         # Arrange
         event = AccountState(
             AccountId("SIM", "001"),
-            [Money(1_000_000, USD)],
-            [Money(1_000_000, USD)],
-            [Money(0, USD)],
+            [ONE_MILLION_USD],
+            [ONE_MILLION_USD],
+            [ZERO_USD],
             info={"default_currency": "USD"},  # Set the default currency
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -99,14 +101,14 @@ class AccountTests(unittest.TestCase):
         self.assertEqual(event, account.last_event)
         self.assertEqual([event], account.events)
         self.assertEqual(1, account.event_count)
-        self.assertEqual(Money(1_000_000, USD), account.balance())
-        self.assertEqual(Money(1_000_000, USD), account.balance_free())
-        self.assertEqual(Money(0, USD), account.balance_locked())
-        self.assertEqual({USD: Money(1_000_000, USD)}, account.balances())
-        self.assertEqual({USD: Money(1_000_000, USD)}, account.balances_free())
-        self.assertEqual({USD: Money(0, USD)}, account.balances_locked())
-        self.assertEqual(Money(0, USD), account.unrealized_pnl())
-        self.assertEqual(Money(1_000_000, USD), account.equity())
+        self.assertEqual(ONE_MILLION_USD, account.balance())
+        self.assertEqual(ONE_MILLION_USD, account.balance_free())
+        self.assertEqual(ZERO_USD, account.balance_locked())
+        self.assertEqual({USD: ONE_MILLION_USD}, account.balances())
+        self.assertEqual({USD: ONE_MILLION_USD}, account.balances_free())
+        self.assertEqual({USD: ZERO_USD}, account.balances_locked())
+        self.assertEqual(ZERO_USD, account.unrealized_pnl())
+        self.assertEqual(ONE_MILLION_USD, account.equity())
         self.assertEqual({}, account.initial_margins())
         self.assertEqual({}, account.maint_margins())
         self.assertEqual(None, account.initial_margin())
@@ -120,7 +122,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -165,7 +167,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -182,7 +184,7 @@ class AccountTests(unittest.TestCase):
             [Money("8.50000000", BTC), Money("20.00000000", ETH)],
             [Money("0.50000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -208,7 +210,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -236,7 +238,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -260,11 +262,11 @@ class AccountTests(unittest.TestCase):
         # Arrange
         event = AccountState(
             AccountId("SIM", "001"),
-            balances=[Money(1_000_000, USD)],
-            balances_free=[Money(1_000_000, USD)],
-            balances_locked=[Money(0, USD)],
+            balances=[ONE_MILLION_USD],
+            balances_free=[ONE_MILLION_USD],
+            balances_locked=[ZERO_USD],
             info={"default_currency": "USD"},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -278,7 +280,7 @@ class AccountTests(unittest.TestCase):
         result = account.unrealized_pnl()
 
         # Assert
-        self.assertEqual(Money(0, USD), result)
+        self.assertEqual(ZERO_USD, result)
 
     def test_unrealized_pnl_with_multi_asset_account_when_no_open_positions_returns_zero(self):
         # Arrange
@@ -288,7 +290,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -312,7 +314,7 @@ class AccountTests(unittest.TestCase):
             [Money("0.00", USD)],
             [Money("0.00", USD)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -336,7 +338,7 @@ class AccountTests(unittest.TestCase):
             [Money("0.00", USD)],
             [Money("0.00", USD)],
             info={"default_currency": "USD"},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -360,7 +362,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -384,7 +386,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -408,7 +410,7 @@ class AccountTests(unittest.TestCase):
             [Money("0.00", USD)],
             [Money("0.00", USD)],
             info={"default_currency": "USD"},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 
@@ -438,7 +440,7 @@ class AccountTests(unittest.TestCase):
             [Money("10.00000000", BTC), Money("20.00000000", ETH)],
             [Money("0.00000000", BTC), Money("0.00000000", ETH)],
             info={},  # No default currency set
-            event_id=uuid4(),
+            event_id=UUID_FACTORY.generate(),
             event_timestamp=UNIX_EPOCH,
         )
 